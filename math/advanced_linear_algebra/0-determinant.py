@@ -5,6 +5,9 @@
 """
 
 
+det = __import__('lu_decomposition').det
+
+
 def determinant(matrix):
     """
     Calculates the determinant of a matrix
@@ -29,28 +32,4 @@ def determinant(matrix):
             return 1
         if len(row) != height:
             raise ValueError("matrix must be a square matrix")
-    if height is 1:
-        return matrix[0][0]
-    if height is 2:
-        a = matrix[0][0]
-        b = matrix[0][1]
-        c = matrix[1][0]
-        d = matrix[1][1]
-        return (a * d) - (b * c)
-    multiplier = 1
-    d = 0
-    for i in range(height):
-        element = matrix[0][i]
-        sub_matrix = []
-        for row in range(height):
-            if row == 0:
-                continue
-            new_row = []
-            for column in range(height):
-                if column == i:
-                    continue
-                new_row.append(matrix[row][column])
-            sub_matrix.append(new_row)
-        d += (element * multiplier * determinant(sub_matrix))
-        multiplier *= -1
-    return d
+    return det(matrix)
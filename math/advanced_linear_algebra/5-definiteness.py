@@ -1,11 +1,72 @@
 #!/usr/bin/env python3
 """
-Defines function that calculates the definiteness of a matrix
+Defines functions that calculate the definiteness of a matrix
+or of a whole stack of matrices at once
 """
 
 
 import numpy as np
 
+LABELS = ("Positive definite", "Positive semi-definite",
+          "Negative definite", "Negative semi-definite", "Indefinite")
+NOT_SYMMETRIC = -1
+
+
+def definiteness_codes(matrices, tol=None):
+    """
+    Calculates the definiteness of every matrix in a stack
+
+    parameters:
+        matrices [numpy.ndarray of shape(..., n, n)]:
+            stack of matrices whose definiteness should be calculated
+        tol [float or None]:
+            eigenvalues with absolute value <= tol count as zero,
+            defaults to max(|eigenvalue|) * n * eps for each matrix
+
+    returns:
+        numpy.ndarray of shape(...) with, for each matrix, the index of
+            its definiteness in LABELS, or NOT_SYMMETRIC
+    """
+    if type(matrices) is not np.ndarray:
+        raise TypeError("matrices must be a numpy.ndarray")
+    if matrices.ndim < 2 or matrices.shape[-1] != matrices.shape[-2]:
+        raise ValueError("matrices must have shape (..., n, n)")
+    n = matrices.shape[-1]
+    symmetric = np.all(matrices == np.swapaxes(matrices, -1, -2),
+                       axis=(-2, -1))
+    eigenvalues = np.linalg.eigvalsh(matrices)
+    if tol is None:
+        tol = np.max(np.abs(eigenvalues), axis=-1, keepdims=True, initial=0)
+        tol = tol * n * np.finfo(eigenvalues.dtype).eps
+    positive = np.any(eigenvalues > tol, axis=-1)
+    negative = np.any(eigenvalues < -tol, axis=-1)
+    zero = np.any(np.abs(eigenvalues) <= tol, axis=-1)
+    codes = np.full(symmetric.shape, 4, dtype=np.int8)
+    codes[positive & ~negative & ~zero] = 0
+    codes[positive & ~negative & zero] = 1
+    codes[negative & ~positive & ~zero] = 2
+    codes[negative & ~positive & zero] = 3
+    codes[~symmetric] = NOT_SYMMETRIC
+    return codes
+
+
+def definiteness_labels(matrices, tol=None):
+    """
+    Calculates the definiteness of every matrix in a stack as strings
+
+    parameters:
+        matrices [numpy.ndarray of shape(..., n, n)]:
+            stack of matrices whose definiteness should be calculated
+        tol [float or None]:
+            zero tolerance for the eigenvalues, see definiteness_codes
+
+    returns:
+        numpy.ndarray of shape(...) and dtype object holding the
+            definiteness string of each matrix, or None if not symmetric
+    """
+    lookup = np.array(LABELS + (None,), dtype=object)
+    return lookup[definiteness_codes(matrices, tol)]
+
 
 def definiteness(matrix):
     """
@@ -28,23 +89,7 @@ def definiteness(matrix):
     if len(matrix.shape) != 2 or matrix.shape[0] != matrix.shape[1] or \
        np.array_equal(matrix, matrix.T) is False:
         return None
-    positive = 0
-    negative = 0
-    zero = 0
-    eigenvalues = np.linalg.eig(matrix)[0]
-    for value in eigenvalues:
-        if value > 0:
-            positive += 1
-        if value < 0:
-            negative += 1
-        if value == 0 or value == 0.:
-            zero += 1
-    if positive and zero and negative == 0:
-        return ("Positive semi-definite")
-    elif negative and zero and positive == 0:
-        return ("Negative semi-definite")
-    elif positive and negative == 0:
-        return ("Positive definite")
-    elif negative and positive == 0:
-        return ("Negative definite")
-    return ("Indefinite")
+    code = definiteness_codes(matrix)
+    if code == NOT_SYMMETRIC:
+        return None
+    return LABELS[code]
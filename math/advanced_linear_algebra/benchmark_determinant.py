@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the recursive cofactor expansion determinant against the
+factorization based one from lu_decomposition, for n = 4..200
+
+The recursive path is O(n!) so it is only timed while n <= RECURSIVE_MAX
+"""
+
+
+import random
+import time
+lu_decomposition = __import__('lu_decomposition')
+det = lu_decomposition.det
+
+RECURSIVE_MAX = 8
+SIZES = [4, 5, 6, 7, 8, 10, 25, 50, 100, 150, 200]
+
+
+def recursive_determinant(matrix):
+    """
+    Calculates the determinant of a matrix by cofactor expansion
+        along the first row (the previous implementation)
+
+    parameters:
+        matrix [list of lists]:
+            matrix whose determinant should be calculated
+
+    returns:
+        the determinant of matrix
+    """
+    height = len(matrix)
+    if height == 1:
+        return matrix[0][0]
+    if height == 2:
+        return matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
+    multiplier = 1
+    d = 0
+    for i in range(height):
+        sub_matrix = [row[:i] + row[i + 1:] for row in matrix[1:]]
+        d += matrix[0][i] * multiplier * recursive_determinant(sub_matrix)
+        multiplier *= -1
+    return d
+
+
+def best_time(function, matrix, repeat=3):
+    """
+    Times a function on a matrix, clearing the factorization cache
+        before every run so that none of them is a cache hit
+
+    parameters:
+        function [callable]:
+            determinant implementation to time
+        matrix [list of lists]:
+            matrix to pass to function
+        repeat [int]:
+            number of runs, the fastest one is kept
+
+    returns:
+        the fastest run time in seconds
+    """
+    best = None
+    for _ in range(repeat):
+        lu_decomposition.cache_clear()
+        start = time.perf_counter()
+        function(matrix)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    print("{:>5} {:>8} {:>14} {:>14} {:>14}".format(
+        "n", "dtype", "recursive (s)", "lu/bareiss (s)", "speedup"))
+    for n in SIZES:
+        integers = [[random.randint(-9, 9) for _ in range(n)]
+                    for _ in range(n)]
+        floats = [[random.uniform(-1, 1) for _ in range(n)]
+                  for _ in range(n)]
+        for name, matrix in (("int", integers), ("float", floats)):
+            new = best_time(det, matrix)
+            if n <= RECURSIVE_MAX:
+                old = best_time(recursive_determinant, matrix, repeat=1)
+                print("{:>5} {:>8} {:>14.6f} {:>14.6f} {:>13.1f}x".format(
+                    n, name, old, new, old / new))
+            else:
+                print("{:>5} {:>8} {:>14} {:>14.6f} {:>14}".format(
+                    n, name, "skipped", new, "-"))
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Defines the shared factorization routines used by the
+advanced linear algebra functions (determinant, minor, cofactor,
+adjugate and inverse)
+
+Integer matrices go through fraction-free Bareiss elimination so
+results stay exact, every other matrix goes through an LU
+factorization with partial pivoting
+
+Factorizations are memoized in an LRU cache keyed by the matrix
+contents, so asking for the determinant, minor, cofactor, adjugate and
+inverse of the same matrix only factorizes it once; the cache keeps
+the factorizations alone, O(n ** 2) each, and the adjugate and inverse
+are derived from them on every call
+"""
+
+
+from functools import lru_cache
+
+CACHE_SIZE = 128
+
+
+def is_integer_matrix(matrix):
+    """
+    Checks if every element of a matrix is a Python integer
+
+    parameters:
+        matrix [list of lists]:
+            matrix to check
+
+    returns:
+        True if all elements are ints, False otherwise
+    """
+    for row in matrix:
+        for value in row:
+            if type(value) is not int:
+                return False
+    return True
+
+
+def bareiss(matrix):
+    """
+    Performs fraction-free (Bareiss) elimination of an integer matrix
+
+    parameters:
+        matrix [list of lists]:
+            square integer matrix to eliminate
+
+    returns:
+        (echelon, sign, steps) where echelon is the eliminated matrix,
+            sign is the parity of the row swaps and steps records, for
+            every pivot k, the row swapped with row k (or None) and the
+            factors of the rows below it, so that bareiss_replay can
+            apply the same elimination to other columns;
+            or (None, 0, None) if matrix is singular
+        the determinant of matrix is sign * echelon[n - 1][n - 1]
+    """
+    n = len(matrix)
+    echelon = [list(row) for row in matrix]
+    sign = 1
+    previous = 1
+    steps = []
+    for k in range(n - 1):
+        swap = None
+        if echelon[k][k] == 0:
+            for i in range(k + 1, n):
+                if echelon[i][k] != 0:
+                    echelon[k], echelon[i] = echelon[i], echelon[k]
+                    sign = -sign
+                    swap = i
+                    break
+            else:
+                return None, 0, None
+        pivot_row = echelon[k]
+        pivot = pivot_row[k]
+        factors = []
+        for i in range(k + 1, n):
+            row = echelon[i]
+            factor = row[k]
+            factors.append(factor)
+            for j in range(k + 1, n):
+                row[j] = (row[j] * pivot - factor * pivot_row[j]) // previous
+            row[k] = 0
+        steps.append((swap, factors))
+        previous = pivot
+    if echelon[n - 1][n - 1] == 0:
+        return None, 0, None
+    return echelon, sign, steps
+
+
+def bareiss_replay(echelon, steps, columns):
+    """
+    Applies a recorded Bareiss elimination to extra columns, giving the
+        columns that eliminating [matrix|columns] would have given, since
+        every column is only combined with the pivot column
+
+    parameters:
+        echelon [list of lists]:
+            eliminated matrix returned by bareiss
+        steps [list]:
+            steps returned by bareiss
+        columns [list of lists]:
+            rows of the columns to eliminate
+
+    returns:
+        the eliminated rows of columns
+    """
+    rows = [list(row) for row in columns]
+    previous = 1
+    for k, (swap, factors) in enumerate(steps):
+        if swap is not None:
+            rows[k], rows[swap] = rows[swap], rows[k]
+        pivot_row = rows[k]
+        pivot = echelon[k][k]
+        for i, factor in enumerate(factors, k + 1):
+            row = rows[i]
+            for j in range(len(row)):
+                row[j] = (row[j] * pivot - factor * pivot_row[j]) // previous
+        previous = pivot
+    return rows
+
+
+def lu_decompose(matrix):
+    """
+    Calculates the LU factorization of a matrix with partial pivoting,
+        such that P * matrix = L * U
+
+    parameters:
+        matrix [list of lists]:
+            square matrix to factorize
+
+    returns:
+        (lu, perm, sign) where lu holds U on and above the diagonal
+            and the unit lower triangular L below it, perm is the row
+            permutation and sign is its parity,
+            or (None, None, 0) if matrix is singular
+    """
+    n = len(matrix)
+    lu = [[float(value) for value in row] for row in matrix]
+    perm = list(range(n))
+    sign = 1
+    for k in range(n):
+        pivot_i = max(range(k, n), key=lambda i: abs(lu[i][k]))
+        if lu[pivot_i][k] == 0:
+            return None, None, 0
+        if pivot_i != k:
+            lu[k], lu[pivot_i] = lu[pivot_i], lu[k]
+            perm[k], perm[pivot_i] = perm[pivot_i], perm[k]
+            sign = -sign
+        pivot_row = lu[k]
+        pivot = pivot_row[k]
+        for i in range(k + 1, n):
+            row = lu[i]
+            factor = row[k] / pivot
+            row[k] = factor
+            if factor == 0:
+                continue
+            for j in range(k + 1, n):
+                row[j] -= factor * pivot_row[j]
+    return lu, perm, sign
+
+
+def lu_solve(lu, perm, rhs):
+    """
+    Solves matrix * x = rhs using the factorization from lu_decompose
+
+    parameters:
+        lu [list of lists]:
+            packed factorization returned by lu_decompose
+        perm [list]:
+            row permutation returned by lu_decompose
+        rhs [list]:
+            right hand side vector
+
+    returns:
+        the solution vector x
+    """
+    n = len(lu)
+    x = [rhs[p] for p in perm]
+    for i in range(n):
+        row = lu[i]
+        total = x[i]
+        for j in range(i):
+            total -= row[j] * x[j]
+        x[i] = total
+    for i in range(n - 1, -1, -1):
+        row = lu[i]
+        total = x[i]
+        for j in range(i + 1, n):
+            total -= row[j] * x[j]
+        x[i] = total / row[i]
+    return x
+
+
+def submatrix(matrix, row_i, column_i):
+    """
+    Builds the matrix left after removing one row and one column
+
+    parameters:
+        matrix [list of lists]:
+            matrix to take the submatrix from
+        row_i [int]:
+            index of the row to remove
+        column_i [int]:
+            index of the column to remove
+
+    returns:
+        the submatrix
+    """
+    return [row[:column_i] + row[column_i + 1:]
+            for i, row in enumerate(matrix) if i != row_i]
+
+
+class Factorization:
+    """
+    Holds the factorization of a non-empty square matrix, from which
+        the adjugate and inverse are derived when asked for; they are
+        not kept, so a cached factorization stays O(n ** 2)
+
+    Integer matrices are eliminated with Bareiss, recording the steps
+        so that the identity can be eliminated the same way to recover
+        the adjugate exactly; every other matrix is LU factorized with
+        partial pivoting
+    """
+
+    def __init__(self, matrix, integer):
+        """
+        Factorizes matrix
+
+        parameters:
+            matrix [tuple of tuples]:
+                non-empty square matrix to factorize
+            integer [bool]:
+                True if every element of matrix is an int
+        """
+        n = len(matrix)
+        self.matrix = matrix
+        self.integer = integer
+        self.n = n
+        if n == 1:
+            self.singular = matrix[0][0] == 0
+            self.det = matrix[0][0]
+            return
+        if integer:
+            self.echelon, sign, self.steps = bareiss(matrix)
+            self.singular = self.echelon is None
+            self.det = 0 if self.singular else sign * self.echelon[-1][n - 1]
+            return
+        self.lu, self.perm, sign = lu_decompose(matrix)
+        self.singular = self.lu is None
+        self.det = 0.0
+        if not self.singular:
+            self.det = float(sign)
+            for i in range(n):
+                self.det *= self.lu[i][i]
+
+    @property
+    def adjugate(self):
+        """
+        The adjugate of the matrix
+
+        For a non-singular matrix every minor is a rank-one update of the
+            factorization: adj(A) = det(A) * inverse(A), so the whole
+            adjugate costs n triangular solves; singular matrices fall back
+            to one determinant per entry
+        """
+        n = self.n
+        d = self.det
+        if n == 1:
+            adjugate = [[1]]
+        elif self.singular:
+            adjugate = []
+            for i in range(n):
+                adjugate_row = []
+                for j in range(n):
+                    sub_matrix = submatrix(self.matrix, j, i)
+                    sub_det = Factorization(sub_matrix, self.integer).det
+                    adjugate_row.append((-1) ** (i + j) * sub_det)
+                adjugate.append(adjugate_row)
+        elif self.integer:
+            echelon = self.echelon
+            identity = [[int(i == j) for j in range(n)] for i in range(n)]
+            eliminated = bareiss_replay(echelon, self.steps, identity)
+            adjugate = [[0] * n for _ in range(n)]
+            for column in range(n):
+                for i in range(n - 1, -1, -1):
+                    row = echelon[i]
+                    total = d * eliminated[i][column]
+                    for k in range(i + 1, n):
+                        total -= row[k] * adjugate[k][column]
+                    adjugate[i][column] = total // row[i]
+        else:
+            adjugate = [[d * value for value in row] for row in self.inverse]
+        return adjugate
+
+    @property
+    def inverse(self):
+        """
+        The inverse of the matrix, or None if the matrix is singular
+        """
+        if self.singular:
+            return None
+        n = self.n
+        if n == 1:
+            inverse = [[1 / self.det]]
+        elif self.integer:
+            d = self.det
+            inverse = [[value / d for value in row] for row in self.adjugate]
+        else:
+            inverse = [[0.0] * n for _ in range(n)]
+            for column in range(n):
+                unit = [0.0] * n
+                unit[column] = 1.0
+                x = lu_solve(self.lu, self.perm, unit)
+                for i in range(n):
+                    inverse[i][column] = x[i]
+        return inverse
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def cached_factorization(key):
+    """
+    Memoized Factorization constructor
+
+    parameters:
+        key [tuple]:
+            (integer, rows) as built by factorize
+
+    returns:
+        the Factorization of rows
+    """
+    integer, rows = key
+    return Factorization(rows, integer)
+
+
+def factorize(matrix):
+    """
+    Gets the factorization of a validated, non-empty square matrix,
+        reusing a cached one if the same contents were seen recently
+
+    parameters:
+        matrix [list of lists]:
+            matrix to factorize
+
+    returns:
+        the Factorization of matrix
+    """
+    rows = tuple(tuple(row) for row in matrix)
+    return cached_factorization((is_integer_matrix(rows), rows))
+
+
+cache_info = cached_factorization.cache_info
+cache_clear = cached_factorization.cache_clear
+
+
+def det(matrix):
+    """
+    Calculates the determinant of a validated, non-empty square matrix
+
+    parameters:
+        matrix [list of lists]:
+            matrix whose determinant should be calculated
+
+    returns:
+        the determinant of matrix, as an exact int for integer matrices
+    """
+    return factorize(matrix).det
+
+
+def adjugate_matrix(matrix):
+    """
+    Calculates the adjugate of a validated, non-empty square matrix
+
+    parameters:
+        matrix [list of lists]:
+            matrix whose adjugate should be calculated
+
+    returns:
+        the adjugate of matrix, exact for integer matrices
+    """
+    return [list(row) for row in factorize(matrix).adjugate]
+
+
+def cofactor_matrix(matrix):
+    """
+    Calculates the cofactor matrix of a validated, non-empty square matrix
+
+    parameters:
+        matrix [list of lists]:
+            matrix whose cofactor matrix should be calculated
+
+    returns:
+        the cofactor matrix of matrix (the transpose of its adjugate)
+    """
+    adjugate = factorize(matrix).adjugate
+    n = len(adjugate)
+    return [[adjugate[j][i] for j in range(n)] for i in range(n)]
+
+
+def minor_matrix(matrix):
+    """
+    Calculates the minor matrix of a validated, non-empty square matrix
+
+    parameters:
+        matrix [list of lists]:
+            matrix whose minor matrix should be calculated
+
+    returns:
+        the minor matrix of matrix
+    """
+    adjugate = factorize(matrix).adjugate
+    n = len(adjugate)
+    return [[adjugate[j][i] if (i + j) % 2 == 0 else -adjugate[j][i]
+             for j in range(n)] for i in range(n)]
+
+
+def inverse_matrix(matrix):
+    """
+    Calculates the inverse of a validated, non-empty square matrix
+
+    parameters:
+        matrix [list of lists]:
+            matrix whose inverse should be calculated
+
+    returns:
+        the inverse of matrix, or None if matrix is singular
+    """
+    inverse = factorize(matrix).inverse
+    if inverse is None:
+        return None
+    return [list(row) for row in inverse]
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Shared, log-space implementation of the likelihood, intersection,
+marginal and posterior of binomial observations over a grid of
+hypothetical probabilities
+"""
+
+
+import numpy as np
+from scipy.special import gammaln
+
+
+def check_observations(x, n):
+    """
+    Validates the observations
+
+    Args:
+        x is the number of patients that develop severe side effects,
+            or a 1D array with one count per observation
+        n is the total number of patients observed,
+            or a 1D array with one total per observation
+
+    Returns:
+        x and n as 1D numpy.ndarrays of the same length
+    """
+    if np.ndim(n) == 0:
+        if not isinstance(n, int) or n <= 0:
+            raise ValueError("n must be a positive integer")
+    elif not np.issubdtype(np.asarray(n).dtype, np.integer) or \
+            np.any(np.asarray(n) <= 0):
+        raise ValueError("n must be a positive integer")
+    if np.ndim(x) == 0:
+        if not isinstance(x, int) or x < 0:
+            raise ValueError(
+                "x must be an integer that is greater than or equal to 0"
+            )
+    elif not np.issubdtype(np.asarray(x).dtype, np.integer) or \
+            np.any(np.asarray(x) < 0):
+        raise ValueError(
+            "x must be an integer that is greater than or equal to 0"
+        )
+    x, n = np.broadcast_arrays(np.atleast_1d(x), np.atleast_1d(n))
+    if np.any(x > n):
+        raise ValueError("x cannot be greater than n")
+    return x, n
+
+
+def check_hypotheses(P, Pr=None):
+    """
+    Validates the hypothetical probabilities and their priors
+        with array reductions
+
+    Args:
+        P is a 1D numpy.ndarray containing the various hypothetical
+            probabilities of developing severe side effects
+        Pr is a 1D numpy.ndarray containing the prior beliefs of P,
+            or None if there are no priors to check
+    """
+    if not isinstance(P, np.ndarray) or len(P.shape) != 1:
+        raise TypeError("P must be a 1D numpy.ndarray")
+    if Pr is not None and \
+            (not isinstance(Pr, np.ndarray) or Pr.shape != P.shape):
+        raise TypeError(
+            "Pr must be a numpy.ndarray with the same shape as P"
+        )
+    if np.any((P < 0) | (P > 1)):
+        raise ValueError("All values in P must be in the range [0, 1]")
+    if Pr is None:
+        return
+    if np.any((Pr < 0) | (Pr > 1)):
+        raise ValueError("All values in Pr must be in the range [0, 1]")
+    if not np.isclose(np.sum(Pr), 1):
+        raise ValueError("Pr must sum to 1")
+
+
+def log_likelihood(x, n, P):
+    """
+    Calculates the log likelihood of validated observations
+
+    The binomial coefficients are evaluated with gammaln over the x and
+        n arrays at once, and since the observations share P only the
+        total successes and failures touch the grid
+
+    Args:
+        x is a 1D numpy.ndarray with the successes of each observation
+        n is a 1D numpy.ndarray with the trials of each observation
+        P is a 1D numpy.ndarray of hypothetical probabilities
+
+    Returns:
+        1D numpy.ndarray with the log likelihood for each value of P
+    """
+    log_coefficient = np.sum(gammaln(n + 1.) - gammaln(x + 1.) -
+                             gammaln(n - x + 1.))
+    successes = int(np.sum(x))
+    failures = int(np.sum(n - x))
+    with np.errstate(divide='ignore'):
+        log_likelihood = np.full(P.shape, float(log_coefficient))
+        if successes:
+            log_likelihood += successes * np.log(P)
+        if failures:
+            log_likelihood += failures * np.log1p(-P)
+    return log_likelihood
+
+
+def bayesian_update(x, n, P, Pr):
+    """
+    Calculates, in one pass, the likelihood, intersection, marginal
+        and posterior of validated observations
+
+    Args:
+        x is a 1D numpy.ndarray with the successes of each observation
+        n is a 1D numpy.ndarray with the trials of each observation
+        P is a 1D numpy.ndarray of hypothetical probabilities
+        Pr is a 1D numpy.ndarray containing the prior beliefs of P
+
+    Returns:
+        likelihood, intersection, marginal, posterior
+    """
+    log_lik = log_likelihood(x, n, P)
+    with np.errstate(divide='ignore'):
+        log_intersection = log_lik + np.log(Pr)
+    peak = np.max(log_intersection)
+    if not np.isfinite(peak):
+        return (np.exp(log_lik), np.zeros(P.shape), 0.,
+                np.full(P.shape, np.nan))
+    scaled = np.exp(log_intersection - peak)
+    total = np.sum(scaled)
+    marginal = np.exp(peak) * total
+    posterior = scaled / total
+    return np.exp(log_lik), np.exp(log_intersection), marginal, posterior
+
+
+def fused_posterior(x, n, P, Pr):
+    """
+    Validates the observations and hypotheses, then calculates the
+        likelihood, intersection, marginal and posterior in one pass
+
+    Args:
+        x is the number of patients that develop severe side effects,
+            or a 1D array with one count per observation
+        n is the total number of patients observed,
+            or a 1D array with one total per observation
+        P is a 1D numpy.ndarray containing the various hypothetical
+            probabilities of developing severe side effects
+        Pr is a 1D numpy.ndarray containing the prior beliefs of P
+
+    Returns:
+        likelihood, intersection, marginal, posterior
+    """
+    x, n = check_observations(x, n)
+    check_hypotheses(P, Pr)
+    return bayesian_update(x, n, P, Pr)
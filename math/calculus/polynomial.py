@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+'''
+    class Polynomial that represents a polynomial
+    stored as a contiguous array of coefficients
+'''
+
+
+import numpy as np
+
+FFT_THRESHOLD = 64
+
+
+class Polynomial:
+    '''
+        Polynomial whose coefficients follow the convention of
+        poly_derivative and poly_integral: the index of a coefficient
+        is the power of x it multiplies, e.g. [5, 3, 0, 1] is
+        x^3 + 3x + 5
+    '''
+
+    def __init__(self, coefficients):
+        '''
+            Class constructor
+
+            coefficients: list or 1D numpy.ndarray of numbers
+        '''
+        coefficients = np.array(coefficients, dtype=np.float64, ndmin=1)
+        if coefficients.ndim != 1 or coefficients.size == 0:
+            raise TypeError("coefficients must be a non-empty 1D list")
+        nonzero = np.flatnonzero(coefficients)
+        length = nonzero[-1] + 1 if nonzero.size else 1
+        self.coefficients = np.ascontiguousarray(coefficients[:length])
+
+    @property
+    def degree(self):
+        '''
+            Degree of the polynomial (0 for constants, including 0)
+        '''
+        return self.coefficients.size - 1
+
+    def __repr__(self):
+        '''
+            Representation of the polynomial
+        '''
+        return "Polynomial({})".format(self.coefficients.tolist())
+
+    def __eq__(self, other):
+        '''
+            Two polynomials are equal if they have the same coefficients
+        '''
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        return np.array_equal(self.coefficients, other.coefficients)
+
+    def tolist(self):
+        '''
+            Coefficients as a list, in the poly_derivative convention
+        '''
+        return self.coefficients.tolist()
+
+    def __call__(self, x):
+        '''
+            Evaluates the polynomial with Horner's rule
+
+            x: number or numpy.ndarray of any shape, evaluated elementwise
+        '''
+        x = np.asarray(x, dtype=np.float64)
+        result = np.full(x.shape, self.coefficients[-1])
+        for coefficient in self.coefficients[-2::-1]:
+            result *= x
+            result += coefficient
+        if result.ndim == 0:
+            return float(result)
+        return result
+
+    def derivative(self):
+        '''
+            Calculates the derivative of the polynomial
+        '''
+        if self.degree == 0:
+            return Polynomial([0])
+        powers = np.arange(1, self.coefficients.size)
+        return Polynomial(self.coefficients[1:] * powers)
+
+    def integral(self, C=0):
+        '''
+            Calculates the integral of the polynomial
+
+            C: integration constant
+        '''
+        powers = np.arange(1, self.coefficients.size + 1)
+        return Polynomial(np.concatenate(([C], self.coefficients / powers)))
+
+    def __add__(self, other):
+        '''
+            Adds two polynomials
+        '''
+        if not isinstance(other, Polynomial):
+            other = Polynomial(other)
+        size = max(self.coefficients.size, other.coefficients.size)
+        total = np.zeros(size)
+        total[:self.coefficients.size] += self.coefficients
+        total[:other.coefficients.size] += other.coefficients
+        return Polynomial(total)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        '''
+            Negates the polynomial
+        '''
+        return Polynomial(-self.coefficients)
+
+    def __sub__(self, other):
+        '''
+            Subtracts two polynomials
+        '''
+        if not isinstance(other, Polynomial):
+            other = Polynomial(other)
+        return self + (-other)
+
+    def __mul__(self, other):
+        '''
+            Multiplies two polynomials, through FFT once the product
+            has at least FFT_THRESHOLD coefficients
+        '''
+        if not isinstance(other, Polynomial):
+            other = Polynomial(other)
+        a = self.coefficients
+        b = other.coefficients
+        size = a.size + b.size - 1
+        if size < FFT_THRESHOLD:
+            return Polynomial(np.convolve(a, b))
+        n = 1 << (size - 1).bit_length()
+        product = np.fft.irfft(np.fft.rfft(a, n) * np.fft.rfft(b, n), n)
+        return Polynomial(product[:size])
+
+    __rmul__ = __mul__
+
+    def roots(self):
+        '''
+            Calculates the roots of the polynomial as the eigenvalues
+            of its companion matrix
+
+            Returns: numpy.ndarray of the degree roots (complex if needed)
+        '''
+        coefficients = self.coefficients
+        degree = self.degree
+        if degree == 0:
+            return np.array([])
+        companion = np.zeros((degree, degree))
+        companion[1:, :-1] = np.eye(degree - 1)
+        companion[:, -1] = -coefficients[:-1] / coefficients[-1]
+        roots = np.linalg.eigvals(companion)
+        if np.all(np.isreal(roots)):
+            roots = roots.real
+        return np.sort(roots)
@@ -6,6 +6,7 @@
 
 
 import numpy as np
+convolve_engine = __import__('convolution_engine').convolve_engine
 
 
 def convolve_grayscale_same(images, kernel):
@@ -27,7 +28,6 @@ def convolve_grayscale_same(images, kernel):
             the convolved images
 
     '''
-    m = images.shape[0]
     height = images.shape[1]
     width = images.shape[2]
     kh = kernel.shape[0]
@@ -40,12 +40,7 @@ def convolve_grayscale_same(images, kernel):
         pw = (kw - 1) // 2
     else:
         pw = kw // 2
-    images = np.pad(images, ((0, 0), (ph, ph), (pw, pw)),
-                    'constant', constant_values=0)
-    convoluted = np.zeros((m, height, width))
-    for h in range(height):
-        for w in range(width):
-            output = np.sum(images[:, h: h + kh, w: w + kw] * kernel,
-                            axis=1).sum(axis=1)
-            convoluted[:, h, w] = output
-    return convoluted
+    convoluted = convolve_engine(images[..., np.newaxis],
+                                 kernel[:, :, np.newaxis, np.newaxis],
+                                 padding=(ph, pw))
+    return convoluted[:, :height, :width, 0]
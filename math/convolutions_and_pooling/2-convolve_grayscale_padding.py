@@ -6,6 +6,7 @@
 
 
 import numpy as np
+convolve_engine = __import__('convolution_engine').convolve_engine
 
 
 def convolve_grayscale_padding(images, kernel, padding):
@@ -29,20 +30,8 @@ def convolve_grayscale_padding(images, kernel, padding):
             a numpy.ndarray containing
             the convolved images
     '''
-    m = images.shape[0]
-    height = images.shape[1]
-    width = images.shape[2]
-    kh = kernel.shape[0]
-    kw = kernel.shape[1]
     ph, pw = padding
-    images = np.pad(images, ((0, 0), (ph, ph), (pw, pw)),
-                    'constant', constant_values=0)
-    ch = height + (2 * ph) - kh + 1
-    cw = width + (2 * pw) - kw + 1
-    convoluted = np.zeros((m, ch, cw))
-    for h in range(ch):
-        for w in range(cw):
-            output = np.sum(images[:, h: h + kh, w: w + kw] * kernel,
-                            axis=1).sum(axis=1)
-            convoluted[:, h, w] = output
-    return convoluted
+    convoluted = convolve_engine(images[..., np.newaxis],
+                                 kernel[:, :, np.newaxis, np.newaxis],
+                                 padding=(ph, pw))
+    return convoluted[..., 0]
@@ -7,6 +7,7 @@
 
 
 import numpy as np
+convolve_engine = __import__('convolution_engine').convolve_engine
 
 
 def convolve_grayscale(images, kernel, padding="same", stride=(1, 1)):
@@ -39,7 +40,6 @@ def convolve_grayscale(images, kernel, padding="same", stride=(1, 1)):
     Returns:
         a numpy.ndarray containing the convolved images
     """
-    m = images.shape[0]
     height = images.shape[1]
     width = images.shape[2]
     kh = kernel.shape[0]
@@ -54,19 +54,7 @@ def convolve_grayscale(images, kernel, padding="same", stride=(1, 1)):
     else:
         ph = padding[0]
         pw = padding[1]
-    images = np.pad(images, ((0, 0), (ph, ph), (pw, pw)),
-                    "constant", constant_values=0)
-    ch = ((height + (2 * ph) - kh) // sh) + 1
-    cw = ((width + (2 * pw) - kw) // sw) + 1
-    convolved_image = np.zeros((m, ch, cw))
-
-    i = 0
-    for h in range(0, (height + (2 * ph) - kh + 1), sh):
-        j = 0
-        for w in range(0, (width + (2 * pw) - kw + 1), sw):
-            output = np.sum(images[:, h:h + kh, w:w + kw] *
-                            kernel, axis=1).sum(axis=1)
-            convolved_image[:, i, j] = output
-            j += 1
-        i += 1
-    return convolved_image
+    convolved_image = convolve_engine(images[..., np.newaxis],
+                                      kernel[:, :, np.newaxis, np.newaxis],
+                                      padding=(ph, pw), stride=(sh, sw))
+    return convolved_image[..., 0]
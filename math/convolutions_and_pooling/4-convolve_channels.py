@@ -7,6 +7,7 @@
 
 
 import numpy as np
+convolve_engine = __import__('convolution_engine').convolve_engine
 
 
 def convolve_channels(images, kernel, padding='same', stride=(1, 1)):
@@ -52,16 +53,6 @@ def convolve_channels(images, kernel, padding='same', stride=(1, 1)):
         pw = 0
     else:
         ph, pw = padding
-    images = np.pad(images, ((0, 0), (ph, ph), (pw, pw), (0, 0)),
-                    'constant', constant_values=0)
-    ch = ((height + (2 * ph) - kh) // sh) + 1
-    cw = ((width + (2 * pw) - kw) // sw) + 1
-    convoluted = np.zeros((m, ch, cw))
-
-    for i, h in enumerate(range(0, (height + (2 * ph) - kh + 1), sh)):
-        for j, w in enumerate(range(0, (width + (2 * pw) - kw + 1), sw)):
-            output = np.sum(images[:, h: h + kh, w: w + kw, :] * kernel,
-                            axis=(1, 2, 3))
-            convoluted[:, i, j] = output
-
-    return convoluted
+    convoluted = convolve_engine(images, kernel[..., np.newaxis],
+                                 padding=(ph, pw), stride=(sh, sw))
+    return convoluted[..., 0]
@@ -6,7 +6,7 @@
 '''
 
 
-import numpy as np
+convolve_engine = __import__('convolution_engine').convolve_engine
 
 
 def convolve(images, kernels, padding='same', stride=(1, 1)):
@@ -45,26 +45,13 @@ def convolve(images, kernels, padding='same', stride=(1, 1)):
     m, height, width, c = images.shape
     kh, kw, kc, nc = kernels.shape
     sh, sw = stride
-    if padding is 'same':
+    if padding == 'same':
         ph = ((((height - 1) * sh) + kh - height) // 2) + 1
         pw = ((((width - 1) * sw) + kw - width) // 2) + 1
-    elif padding is 'valid':
+    elif padding == 'valid':
         ph = 0
         pw = 0
     else:
         ph, pw = padding
-    images = np.pad(images, ((0, 0), (ph, ph), (pw, pw), (0, 0)),
-                    'constant', constant_values=0)
-    ch = ((height + (2 * ph) - kh) // sh) + 1
-    cw = ((width + (2 * pw) - kw) // sw) + 1
-    convoluted = np.zeros((m, ch, cw, nc))
-
-    for index in range(nc):
-        kernel_index = kernels[:, :, :, index]
-        for i, h in enumerate(range(0, (height + (2 * ph) - kh + 1), sh)):
-            for j, w in enumerate(range(0, (width + (2 * pw) - kw + 1), sw)):
-                output = np.sum(images[:, h: h + kh, w: w + kw, :]
-                                * kernel_index, axis=(1, 2, 3))
-                convoluted[:, i, j, index] = output
-
-    return convoluted
+    return convolve_engine(images, kernels, padding=(ph, pw),
+                           stride=(sh, sw))
@@ -7,9 +7,11 @@
 '''
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 
-def pool(images, kernel_shape, stride, mode='max'):
+def pool(images, kernel_shape, stride, mode='max', batch_size=None,
+         return_indices=False):
     '''
         images: numpy.ndarray with shape (m, h, w, c)
             m: number of images
@@ -23,7 +25,13 @@ def pool(images, kernel_shape, stride, mode='max'):
             sh: stride for the height of the image
             sw: stride for the width of the image
         mode: max or avg
+        batch_size: positive int number of images pooled at a time to
+            bound the peak memory, or None to pool the whole batch at once
+        return_indices: if True with max mode, also return the argmax map
         Returns: numpy.ndarray containing the pooled images
+            and, if return_indices, a numpy.ndarray of the same shape
+            holding for each output the flat index (row * w + col) of the
+            selected pixel in its image and channel
       '''
     m, h, w, c = images.shape  # Unpack the dimensions of the images
     kh, kw = kernel_shape      # Unpack the kernel dimensions
@@ -33,19 +41,43 @@ def pool(images, kernel_shape, stride, mode='max'):
     new_h = (h - kh) // sh + 1
     new_w = (w - kw) // sw + 1
 
+    if return_indices and mode != 'max':
+        raise ValueError("return_indices requires mode='max'")
+    if batch_size is not None:
+        if type(batch_size) is not int:
+            raise TypeError('batch_size must be an integer')
+        if batch_size < 1:
+            raise ValueError('batch_size must be a positive integer')
+
     # Initialize the output array with the appropriate shape
     pooled = np.zeros((m, new_h, new_w, c))
+    if return_indices:
+        indices = np.zeros((m, new_h, new_w, c), dtype=np.intp)
+        # Top left pixel of every window, as a flat index into the image
+        corners = (np.arange(new_h)[:, np.newaxis] * sh * w +
+                   np.arange(new_w) * sw)[:, :, np.newaxis]
 
-    for i in range(new_h):
-        for j in range(new_w):
-            # Extract the current slice of the input image
-            image_slice = images[:, i*sh:i*sh+kh, j*sw:j*sw+kw, :]
+    if batch_size is None:
+        batch_size = max(m, 1)
+    for start in range(0, m, batch_size):
+        end = min(start + batch_size, m)
+        # Strided view of every window, shape (b, new_h, new_w, c, kh, kw)
+        windows = sliding_window_view(images[start:end], (kh, kw),
+                                      axis=(1, 2))[:, ::sh, ::sw]
 
-            if mode == 'max':
-                # Perform max pooling
-                pooled[:, i, j, :] = np.max(image_slice, axis=(1, 2))
-            elif mode == 'avg':
-                # Perform average pooling
-                pooled[:, i, j, :] = np.mean(image_slice, axis=(1, 2))
+        if mode == 'max' and return_indices:
+            flat = windows.reshape(windows.shape[:4] + (kh * kw,))
+            argmax = np.argmax(flat, axis=-1)
+            pooled[start:end] = np.take_along_axis(
+                flat, argmax[..., np.newaxis], axis=-1)[..., 0]
+            indices[start:end] = corners + (argmax // kw) * w + argmax % kw
+        elif mode == 'max':
+            # Perform max pooling
+            pooled[start:end] = np.max(windows, axis=(4, 5))
+        elif mode == 'avg':
+            # Perform average pooling
+            pooled[start:end] = np.mean(windows, axis=(4, 5))
 
+    if return_indices:
+        return pooled, indices
     return pooled
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the loop based convolution against the im2col/GEMM and FFT
+paths of convolution_engine, reporting run time and peak memory
+"""
+
+
+import time
+import tracemalloc
+import numpy as np
+convolve_engine = __import__('convolution_engine').convolve_engine
+
+CASES = [
+    ((32, 28, 28, 1), (3, 3, 1, 8)),
+    ((32, 28, 28, 1), (5, 5, 1, 16)),
+    ((16, 64, 64, 3), (3, 3, 3, 16)),
+    ((16, 64, 64, 3), (7, 7, 3, 16)),
+    ((8, 128, 128, 3), (11, 11, 3, 8)),
+    ((8, 128, 128, 3), (15, 15, 3, 8)),
+]
+
+
+def loop_convolve(images, kernels, padding=(0, 0), stride=(1, 1)):
+    """
+    Performs a convolution on images using multiple kernels with one
+        loop per kernel, output row and output column (the previous
+        implementation)
+
+    parameters:
+        images [numpy.ndarray with shape (m, h, w, c)]:
+            contains multiple images
+        kernels [numpy.ndarray with shape (kh, kw, c, nc)]:
+            contains the kernels for the convolution
+        padding [tuple of (ph, pw)]:
+            zero padding for the height and width of the images
+        stride [tuple of (sh, sw)]:
+            stride for the height and width of the images
+
+    returns:
+        numpy.ndarray with shape (m, ch, cw, nc) of convolved images
+    """
+    m, height, width, c = images.shape
+    kh, kw, kc, nc = kernels.shape
+    ph, pw = padding
+    sh, sw = stride
+    images = np.pad(images, ((0, 0), (ph, ph), (pw, pw), (0, 0)),
+                    'constant', constant_values=0)
+    ch = ((height + (2 * ph) - kh) // sh) + 1
+    cw = ((width + (2 * pw) - kw) // sw) + 1
+    convoluted = np.zeros((m, ch, cw, nc))
+    for index in range(nc):
+        kernel_index = kernels[:, :, :, index]
+        for i, h in enumerate(range(0, (height + (2 * ph) - kh + 1), sh)):
+            for j, w in enumerate(range(0, (width + (2 * pw) - kw + 1), sw)):
+                convoluted[:, i, j, index] = np.sum(
+                    images[:, h: h + kh, w: w + kw, :] * kernel_index,
+                    axis=(1, 2, 3))
+    return convoluted
+
+
+def measure(function, *args, **kwargs):
+    """
+    Times a function, then runs it once more while tracing its memory
+
+    parameters:
+        function [callable]:
+            function to measure
+        args, kwargs:
+            arguments passed to function
+
+    returns:
+        (result, seconds, peak bytes allocated during the call)
+    """
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function(*args, **kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+if __name__ == '__main__':
+    np.random.seed(0)
+    print("{:>18} {:>14} {:>8} {:>10} {:>10} {:>9} {:>10}".format(
+        "images", "kernels", "method", "time (s)", "speedup",
+        "peak MB", "max error"))
+    for image_shape, kernel_shape in CASES:
+        images = np.random.randn(*image_shape)
+        kernels = np.random.randn(*kernel_shape)
+        padding = (kernel_shape[0] // 2, kernel_shape[1] // 2)
+        expected, base, peak = measure(loop_convolve, images, kernels,
+                                       padding)
+        rows = [("loop", base, peak, 0.0)]
+        for method in ('gemm', 'fft'):
+            result, elapsed, peak = measure(convolve_engine, images, kernels,
+                                            padding, method=method)
+            rows.append((method, elapsed, peak,
+                         np.max(np.abs(result - expected))))
+        for method, elapsed, peak, error in rows:
+            print("{:>18} {:>14} {:>8} {:>10.4f} {:>9.1f}x {:>9.1f} "
+                  "{:>10.1e}".format(str(image_shape), str(kernel_shape),
+                                     method, elapsed, base / elapsed,
+                                     peak / 2 ** 20, error))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Defines the vectorized engine shared by all the convolution functions
+
+Small kernels use an im2col strided view of the images followed by a
+single matrix multiplication (GEMM), large kernels switch to FFT, whose
+cost does not grow with the kernel size (see benchmark_convolve.py for
+the crossover that FFT_THRESHOLD is based on)
+
+FFT computes every output before the stride drops some, while GEMM only
+computes the kept ones, so the kernel size is compared against
+FFT_THRESHOLD per output of the unstrided convolution; integer images
+and kernels always use GEMM, whose result is exact where FFT rounds
+"""
+
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+FFT_THRESHOLD = 49
+
+
+def convolve_gemm(images, kernels, stride):
+    """
+    Performs a valid convolution with im2col and matrix multiplication
+
+    parameters:
+        images [numpy.ndarray with shape (m, h, w, c)]:
+            already padded images
+        kernels [numpy.ndarray with shape (kh, kw, c, nc)]:
+            kernels for the convolution
+        stride [tuple of (sh, sw)]:
+            stride for the height and width of the images
+
+    returns:
+        numpy.ndarray with shape (m, ch, cw, nc) of convolved images
+    """
+    kh, kw, c, nc = kernels.shape
+    sh, sw = stride
+    windows = sliding_window_view(images, (kh, kw), axis=(1, 2))
+    windows = windows[:, ::sh, ::sw].transpose(0, 1, 2, 4, 5, 3)
+    m, ch, cw = windows.shape[:3]
+    columns = windows.reshape(m * ch * cw, kh * kw * c)
+    convolved = np.matmul(columns, kernels.reshape(kh * kw * c, nc))
+    return convolved.reshape(m, ch, cw, nc)
+
+
+def convolve_fft(images, kernels, stride):
+    """
+    Performs a valid convolution through the frequency domain
+
+    parameters:
+        images [numpy.ndarray with shape (m, h, w, c)]:
+            already padded images
+        kernels [numpy.ndarray with shape (kh, kw, c, nc)]:
+            kernels for the convolution
+        stride [tuple of (sh, sw)]:
+            stride for the height and width of the images
+
+    returns:
+        numpy.ndarray with shape (m, ch, cw, nc) of convolved images
+    """
+    h, w = images.shape[1:3]
+    kh, kw = kernels.shape[:2]
+    sh, sw = stride
+    image_f = np.fft.rfft2(images, s=(h, w), axes=(1, 2))
+    kernel_f = np.fft.rfft2(kernels[::-1, ::-1], s=(h, w), axes=(0, 1))
+    product = np.einsum('mijc,ijcn->mijn', image_f, kernel_f)
+    convolved = np.fft.irfft2(product, s=(h, w), axes=(1, 2))
+    return convolved[:, kh - 1::sh, kw - 1::sw]
+
+
+def convolve_engine(images, kernels, padding=(0, 0), stride=(1, 1),
+                    method='auto'):
+    """
+    Performs a convolution on images using multiple kernels
+
+    parameters:
+        images [numpy.ndarray with shape (m, h, w, c)]:
+            contains multiple images
+        kernels [numpy.ndarray with shape (kh, kw, c, nc)]:
+            contains the kernels for the convolution
+        padding [tuple of (ph, pw)]:
+            zero padding for the height and width of the images
+        stride [tuple of (sh, sw)]:
+            stride for the height and width of the images
+        method [str]:
+            'gemm', 'fft', or 'auto' to use FFT once the kernel has
+            at least FFT_THRESHOLD elements per stride step (sh * sw),
+            unless both images and kernels are integers
+
+    returns:
+        numpy.ndarray with shape (m, ch, cw, nc) of convolved images
+    """
+    ph, pw = padding
+    if ph or pw:
+        images = np.pad(images, ((0, 0), (ph, ph), (pw, pw), (0, 0)),
+                        'constant', constant_values=0)
+    if method == 'auto':
+        kh, kw = kernels.shape[:2]
+        sh, sw = stride
+        integer = images.dtype.kind in 'iub' and kernels.dtype.kind in 'iub'
+        if not integer and kh * kw >= FFT_THRESHOLD * sh * sw:
+            method = 'fft'
+        else:
+            method = 'gemm'
+    if method == 'fft':
+        convolved = convolve_fft(images, kernels, stride)
+    else:
+        convolved = convolve_gemm(images, kernels, stride)
+    return convolved.astype(np.float64, copy=False)
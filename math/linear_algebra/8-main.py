@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+
+mat_mul = __import__('8-ridin_bareback').mat_mul
+
+if __name__ == '__main__':
+    mat1 = [[1, 2],
+            [3, 4],
+            [5, 6]]
+    mat2 = [[1, 2, 3, 4],
+            [5, 6, 7, 8]]
+    print(mat_mul(mat1, mat2))
+    # above NUMPY_THRESHOLD, bools are still summed as ints
+    ones = [[True] * 5 for _ in range(5)]
+    product = mat_mul(ones, ones)
+    print(product[0])
+    assert product == [[5] * 5 for _ in range(5)]
+    # mixed bools and ints
+    print(mat_mul([[True, False]] * 8, [[3] * 8, [4] * 8])[0])
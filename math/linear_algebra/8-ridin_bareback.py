@@ -5,18 +5,15 @@
 '''
 
 
+matmul = __import__('matmul').matmul
+
+
 def mat_mul(mat1, mat2):
     '''
         A function def mat_mul(mat1, mat2):
         that performs matrix multiplication:
     '''
     if len(mat1[0]) == len(mat2):
-        return [
-            [
-                sum([mat1[i][k] * mat2[k][j] for k in range(len(mat1[0]))])
-                for j in range(len(mat2[0]))
-            ]
-            for i in range(len(mat1))
-        ]
+        return matmul(mat1, mat2)
     else:
         return None
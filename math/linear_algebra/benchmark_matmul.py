@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+'''
+    Times the pure Python and numpy paths of matmul on square float
+    and int matrices to find the crossovers NUMPY_THRESHOLD lies between
+'''
+
+
+import random
+import time
+matmul_module = __import__('matmul')
+
+SIZES = [2, 3, 4, 5, 6, 7, 8, 12, 16, 20, 24, 32, 48, 64, 128]
+
+
+def best_time(function, mat1, mat2, repeat=50):
+    '''
+        Returns the fastest of repeat runs of function(mat1, mat2)
+    '''
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(mat1, mat2)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    print("{:>6} {:>5} {:>10} {:>12} {:>12}".format(
+        "dtype", "n", "n ** 3", "python (s)", "numpy (s)"))
+    crossovers = {}
+    for name, element in (("float", random.random),
+                          ("int", lambda: random.randint(-9, 9))):
+        crossover = None
+        for n in SIZES:
+            mat1 = [[element() for _ in range(n)] for _ in range(n)]
+            mat2 = [[element() for _ in range(n)] for _ in range(n)]
+            python = best_time(matmul_module.matmul_tiled, mat1, mat2)
+            numpy = best_time(matmul_module.matmul_numpy, mat1, mat2)
+            print("{:>6} {:>5} {:>10} {:>12.6f} {:>12.6f}".format(
+                name, n, n ** 3, python, numpy))
+            if numpy >= python:
+                crossover = None
+            elif crossover is None:
+                crossover = n ** 3
+        crossovers[name] = crossover
+    print("numpy is faster from about {} multiply-adds for floats and {} "
+          "for ints (NUMPY_THRESHOLD = {})".format(
+              crossovers["float"], crossovers["int"],
+              matmul_module.NUMPY_THRESHOLD))
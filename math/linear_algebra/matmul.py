@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+'''
+    A function def matmul(mat1, mat2):
+    that performs (batched) matrix multiplication on lists of lists,
+    handing large products over to numpy
+'''
+
+
+from operator import mul
+import numpy as np
+
+# benchmark_matmul.py puts the crossover near 27 multiply-adds for float
+# matrices and near 216 for int ones, whose numpy path also bounds the
+# products against int64 overflow; 64 sits between the two, where
+# either path takes a few microseconds
+NUMPY_THRESHOLD = 64
+TILE = 32
+
+
+def matmul_tiled(mat1, mat2):
+    '''
+        Multiplies two 2D matrices in pure Python
+
+        mat2 is transposed once so every dot product walks two
+        contiguous rows, and the output is filled tile by tile
+        so a block of columns is reused for TILE rows of mat1
+    '''
+    rows = len(mat1)
+    columns = list(zip(*mat2))
+    result = [[0] * len(columns) for _ in range(rows)]
+    for j0 in range(0, len(columns), TILE):
+        block = columns[j0:j0 + TILE]
+        for i0 in range(0, rows, TILE):
+            for i in range(i0, min(i0 + TILE, rows)):
+                row = mat1[i]
+                result_row = result[i]
+                for j, column in enumerate(block, j0):
+                    result_row[j] = sum(map(mul, row, column))
+    return result
+
+
+def magnitude(array):
+    '''
+        Largest absolute value of an integer array, as a Python int
+    '''
+    if array.size == 0:
+        return 0
+    return max(int(array.max()), -int(array.min()))
+
+
+def matmul_numpy(mat1, mat2):
+    '''
+        Multiplies two (batches of) matrices with numpy
+
+        Returns None if the elements cannot be stored in a numeric array,
+        or if an integer product could overflow int64, where Python
+        integers stay exact
+    '''
+    arr1 = np.array(mat1)
+    arr2 = np.array(mat2)
+    if arr1.dtype == object or arr2.dtype == object:
+        return None
+    # np.matmul of bools is an OR of ANDs, Python sums them as ints
+    if arr1.dtype == bool:
+        arr1 = arr1.astype(np.int64)
+    if arr2.dtype == bool:
+        arr2 = arr2.astype(np.int64)
+    if arr1.dtype.kind in 'iu' and arr2.dtype.kind in 'iu':
+        # bound of every dot product, computed with Python integers
+        bound = magnitude(arr1) * magnitude(arr2) * arr1.shape[-1]
+        if bound > np.iinfo(np.int64).max:
+            return None
+    return np.matmul(arr1, arr2).tolist()
+
+
+def matmul(mat1, mat2, threshold=NUMPY_THRESHOLD):
+    '''
+        A function def matmul(mat1, mat2):
+        that performs matrix multiplication:
+
+        mat1 and mat2 are 2D lists of lists, or 3D lists of matrices
+        for a batched product (a 2D operand is used for every matrix
+        of the batch)
+        Products with at least threshold multiply-adds are done by
+        numpy, smaller ones by a tiled pure Python loop
+        Returns None if the matrices cannot be multiplied
+    '''
+    batched1 = isinstance(mat1[0][0], list)
+    batched2 = isinstance(mat2[0][0], list)
+    first1 = mat1[0] if batched1 else mat1
+    first2 = mat2[0] if batched2 else mat2
+    if len(first1[0]) != len(first2):
+        return None
+    if batched1 and batched2 and len(mat1) != len(mat2):
+        return None
+    batch = len(mat1) if batched1 else len(mat2) if batched2 else 1
+    work = batch * len(first1) * len(first2) * len(first2[0])
+    if work >= threshold:
+        result = matmul_numpy(mat1, mat2)
+        if result is not None:
+            return result
+    if not batched1 and not batched2:
+        return matmul_tiled(mat1, mat2)
+    return [matmul_tiled(mat1[b] if batched1 else mat1,
+                         mat2[b] if batched2 else mat2)
+            for b in range(batch)]
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+'''
+    N-dimensional operations on nested lists
+
+    The nested lists are flattened once, level by level, into a
+    contiguous array.array buffer with a shape/strides header, every
+    operation is a single pass over the buffers, and the result is
+    only nested back into lists when tolist() is called
+'''
+
+
+from array import array
+from itertools import chain
+from operator import add, mul
+
+
+def make_buffer(typecode, values):
+    '''
+        Stores values in an array.array of typecode, or in a plain list
+        if they do not fit (big integers, non numeric values)
+    '''
+    values = list(values)
+    if typecode is None:
+        return values
+    try:
+        return array(typecode, values)
+    except (OverflowError, TypeError):
+        return values
+
+
+def common_typecode(*buffers):
+    '''
+        Returns the typecode able to hold the values of all buffers
+    '''
+    typecodes = {getattr(buffer, 'typecode', None) for buffer in buffers}
+    if len(typecodes) != 1:
+        return None
+    return typecodes.pop()
+
+
+class NestedArray:
+    '''
+        Contiguous, flat representation of a rectangular nested list
+    '''
+
+    def __init__(self, buffer, shape):
+        '''
+            buffer: array.array (or list) of the elements in row-major order
+            shape: tuple with the length of every dimension
+        '''
+        self.buffer = buffer
+        self.shape = tuple(shape)
+        strides = []
+        size = 1
+        for length in reversed(self.shape):
+            strides.append(size)
+            size *= length
+        self.strides = tuple(reversed(strides))
+        self.size = size
+
+    @classmethod
+    def from_list(cls, matrix):
+        '''
+            Flattens a rectangular nested list, one level at a time
+
+            Raises a ValueError if matrix is not rectangular
+        '''
+        shape = []
+        level = [matrix]
+        while level and isinstance(level[0], list):
+            length = len(level[0])
+            for sub in level:
+                if not isinstance(sub, list) or len(sub) != length:
+                    raise ValueError("matrix must be rectangular")
+            shape.append(length)
+            level = list(chain.from_iterable(level))
+        for value in level:
+            if isinstance(value, list):
+                raise ValueError("matrix must be rectangular")
+        types = set(map(type, level))
+        if types == {int}:
+            typecode = 'q'
+        elif types == {float}:
+            typecode = 'd'
+        else:
+            typecode = None
+        return cls(make_buffer(typecode, level), shape)
+
+    def tolist(self):
+        '''
+            Nests the buffer back into lists of lists
+        '''
+        values = list(self.buffer)
+        if not self.shape:
+            return values[0]
+        for axis in range(len(self.shape) - 1, 0, -1):
+            length = self.shape[axis]
+            count = 1
+            for outer in self.shape[:axis]:
+                count *= outer
+            values = [values[i * length:(i + 1) * length]
+                      for i in range(count)]
+        return values
+
+    def elementwise(self, other, operator):
+        '''
+            Applies operator to every pair of elements of self and other
+
+            Returns None if the shapes differ
+        '''
+        if self.shape != other.shape:
+            return None
+        typecode = common_typecode(self.buffer, other.buffer)
+        return NestedArray(make_buffer(typecode,
+                                       map(operator, self.buffer,
+                                           other.buffer)),
+                           self.shape)
+
+    def concatenate(self, other, axis=0):
+        '''
+            Concatenates self and other along axis
+
+            Returns None if the other dimensions differ
+        '''
+        if len(self.shape) != len(other.shape) or \
+           not 0 <= axis < len(self.shape):
+            return None
+        for i, (mine, theirs) in enumerate(zip(self.shape, other.shape)):
+            if i != axis and mine != theirs:
+                return None
+        block1 = self.strides[axis] * self.shape[axis]
+        block2 = other.strides[axis] * other.shape[axis]
+        outer = 1
+        for length in self.shape[:axis]:
+            outer *= length
+        typecode = common_typecode(self.buffer, other.buffer)
+        buffer1 = self.buffer
+        buffer2 = other.buffer
+        if typecode is None:
+            buffer1 = list(buffer1)
+            buffer2 = list(buffer2)
+        buffer = make_buffer(typecode, ())
+        for i in range(outer):
+            buffer.extend(buffer1[i * block1:(i + 1) * block1])
+            buffer.extend(buffer2[i * block2:(i + 1) * block2])
+        shape = list(self.shape)
+        shape[axis] += other.shape[axis]
+        return NestedArray(buffer, shape)
+
+    def transpose(self, axes=None):
+        '''
+            Permutes the dimensions, reversing them if axes is None
+        '''
+        if axes is None:
+            axes = tuple(reversed(range(len(self.shape))))
+        indices = [0]
+        for axis in axes:
+            stride = self.strides[axis]
+            indices = [index + k * stride for index in indices
+                       for k in range(self.shape[axis])]
+        typecode = getattr(self.buffer, 'typecode', None)
+        return NestedArray(make_buffer(typecode,
+                                       map(self.buffer.__getitem__,
+                                           indices)),
+                           [self.shape[axis] for axis in axes])
+
+
+def shape(matrix):
+    '''
+        Calculates the shape of a nested list
+    '''
+    return list(NestedArray.from_list(matrix).shape)
+
+
+def cat_matrices(mat1, mat2, axis=0):
+    '''
+        Concatenates two nested lists along a specific axis
+
+        Returns None if they cannot be concatenated
+    '''
+    result = NestedArray.from_list(mat1).concatenate(
+        NestedArray.from_list(mat2), axis)
+    return None if result is None else result.tolist()
+
+
+def add_matrices(mat1, mat2):
+    '''
+        Adds two nested lists element-wise
+
+        Returns None if they do not have the same shape
+    '''
+    result = NestedArray.from_list(mat1).elementwise(
+        NestedArray.from_list(mat2), add)
+    return None if result is None else result.tolist()
+
+
+def mul_matrices(mat1, mat2):
+    '''
+        Multiplies two nested lists element-wise
+
+        Returns None if they do not have the same shape
+    '''
+    result = NestedArray.from_list(mat1).elementwise(
+        NestedArray.from_list(mat2), mul)
+    return None if result is None else result.tolist()
+
+
+def transpose(matrix, axes=None):
+    '''
+        Permutes the dimensions of a nested list,
+        reversing them if axes is None
+    '''
+    return NestedArray.from_list(matrix).transpose(axes).tolist()
@@ -25,11 +25,7 @@ def correlation(C):
     if len(C.shape) != 2 or C.shape[0] != C.shape[1]:
         raise ValueError("C must be a 2D square matrix")
 
-    d = C.shape[0]
-    corr = np.zeros((d, d))
-
-    for i in range(d):
-        for j in range(d):
-            corr[i, j] = C[i, j] / np.sqrt(C[i, i] * C[j, j])
+    stddev = np.sqrt(np.diag(C))
+    corr = C / np.outer(stddev, stddev)
 
     return corr
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+    class MeanCovAccumulator that computes the mean, covariance
+    and correlation of a data set read in chunks
+"""
+
+
+import numpy as np
+correlation = __import__('1-correlation').correlation
+
+
+class MeanCovAccumulator:
+    """
+    class MeanCovAccumulator that accumulates the mean and the sum of
+    squared deviations of a data set one chunk at a time, so the whole
+    data set never has to be in memory
+    """
+
+    def __init__(self, d):
+        """
+        Args:
+            d is the number of dimensions in each data point
+        """
+        if type(d) is not int or d < 1:
+            raise ValueError("d must be a positive integer")
+        self.n = 0
+        self.mean = np.zeros((1, d))
+        self.m2 = np.zeros((d, d))
+
+    def combine(self, n, mean, m2):
+        """
+        merges the statistics of another part of the data set
+            into this accumulator (Chan et al. pairwise update)
+
+        Args:
+            n is the number of data points of the other part
+            mean is a numpy.ndarray of shape (1, d), its mean
+            m2 is a numpy.ndarray of shape (d, d), its sum of
+                squared deviations from its mean
+        """
+        if n == 0:
+            return
+        total = self.n + n
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (n / total)
+        self.m2 = self.m2 + m2 + np.dot(delta.T, delta) * (self.n * n / total)
+        self.n = total
+
+    def update(self, X):
+        """
+        adds a chunk of data points
+
+        Args:
+            X is a numpy.ndarray of shape (k, d) containing the chunk
+
+        Returns:
+            self, so calls can be chained
+        """
+        if not isinstance(X, np.ndarray) or len(X.shape) != 2:
+            raise TypeError("X must be a 2D numpy.ndarray")
+        if X.shape[1] != self.mean.shape[1]:
+            raise ValueError("X must have {} columns".format(
+                self.mean.shape[1]))
+        k = X.shape[0]
+        if k == 0:
+            return self
+        mean = np.mean(X, axis=0, keepdims=True)
+        centered_data = X - mean
+        self.combine(k, mean, np.dot(centered_data.T, centered_data))
+        return self
+
+    def merge(self, other):
+        """
+        adds the data points seen by another accumulator,
+            e.g. one filled by a different worker
+
+        Args:
+            other is a MeanCovAccumulator of the same dimension
+
+        Returns:
+            self, so calls can be chained
+        """
+        if not isinstance(other, MeanCovAccumulator):
+            raise TypeError("other must be a MeanCovAccumulator")
+        if other.mean.shape != self.mean.shape:
+            raise ValueError("other must have the same dimension")
+        self.combine(other.n, other.mean, other.m2)
+        return self
+
+    def finalize(self):
+        """
+        Returns:
+            mean is a numpy.ndarray of shape (1, d) containing the mean
+            of the data set
+            cov is a numpy.ndarray of shape (d, d) containing the
+            covariance matrix of the data set
+        """
+        if self.n < 2:
+            raise ValueError("X must contain multiple data points")
+        return self.mean.copy(), self.m2 / (self.n - 1)
+
+    def correlation(self):
+        """
+        Returns:
+            a numpy.ndarray of shape (d, d) containing the correlation
+            matrix of the data set
+        """
+        return correlation(self.finalize()[1])
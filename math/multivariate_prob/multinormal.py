@@ -6,6 +6,7 @@
 
 
 import numpy as np
+from scipy.linalg import solve_triangular
 
 
 class MultiNormal:
@@ -31,32 +32,62 @@ class MultiNormal:
         self.mean = mean
         cov = np.matmul(data - mean, data.T - mean.T) / (n - 1)
         self.cov = cov
+        # Cholesky factor L of cov, so that (x - mean).T cov^-1 (x - mean)
+        # = |L^-1 (x - mean)|^2, and the log normalization constant
+        try:
+            self.__cholesky = np.linalg.cholesky(cov)
+        except np.linalg.LinAlgError:
+            # the distribution is still built, but has no PDF
+            self.__cholesky = None
+            return
+        log_det = 2 * np.sum(np.log(np.diag(self.__cholesky)))
+        self.__log_norm = -0.5 * (d * np.log(2 * np.pi) + log_det)
+
+    def logpdf(self, x):
+        """
+        calculates the log PDF at one or more data points
+
+        Args:
+            x is a numpy.ndarray of shape (d, n) containing the n data
+                points whose log PDF should be calculated
+                d is the number of dimensions of the Multinomial instance
+
+        Returns:
+            numpy.ndarray of shape (n,) with the log PDF at each point
+        """
+        if type(x) is not np.ndarray:
+            raise TypeError("x must be a numpy.ndarray")
+        d = self.cov.shape[0]
+        if len(x.shape) != 2 or x.shape[0] != d:
+            raise ValueError("x must have the shape ({}, n)".format(d))
+        if self.__cholesky is None:
+            raise np.linalg.LinAlgError("cov is not positive definite")
+        z = solve_triangular(self.__cholesky, x - self.mean, lower=True)
+        return self.__log_norm - 0.5 * np.sum(z * z, axis=0)
 
     def pdf(self, x):
         """
-        calculates the PDF at a data point
+        calculates the PDF at a data point, or at a batch of points
 
         Args:
-            x is a numpy.ndarray of shape (d,) containing the data point
-                whose PDF should be calculated
+            x is a numpy.ndarray of shape (d, 1) containing the data point
+                whose PDF should be calculated, or of shape (d, n)
+                containing n data points
                 d is the number of dimensions of the Multinomial instance
 
         Returns:
-            the PDF at x
+            the PDF at x, or a numpy.ndarray of shape (n,) for a batch
         """
         if type(x) is not np.ndarray:
             raise TypeError("x must be a numpy.ndarray")
         d = self.cov.shape[0]
         if len(x.shape) != 2:
             raise ValueError("x must have the shape ({}, 1)".format(d))
-        test_d, one = x.shape
-        if test_d != d or one != 1:
+        test_d, n = x.shape
+        if test_d != d or n < 1:
             raise ValueError("x must have the shape ({}, 1)".format(d))
 
-        det = np.linalg.det(self.cov)
-        inv = np.linalg.inv(self.cov)
-        pdf = 1.0 / np.sqrt(((2 * np.pi) ** d) * det)
-        mult = np.matmul(np.matmul((x - self.mean).T, inv), (x - self.mean))
-        pdf *= np.exp(-0.5 * mult)
-        pdf = pdf[0][0]
+        pdf = np.exp(self.logpdf(x))
+        if n == 1:
+            return pdf[0]
         return pdf
@@ -4,6 +4,11 @@
 '''
 
 
+from math import lgamma, log, log1p
+import numpy as np
+log_factorials = __import__('distribution_helpers').log_factorials
+
+
 class Binomial:
     '''
         Binomial distribution class
@@ -38,45 +43,54 @@ class Binomial:
             self.n = n
             self.p = p
 
+    def logpmf(self, k):
+        '''
+            Calculates the value of the log PMF for a given number of
+            successes, k may be a number or an array of numbers
+        '''
+        n = self.n
+        log_p = log(self.p)
+        log_q = log1p(-self.p)
+        if np.ndim(k) == 0:
+            k = int(k)
+            if k < 0 or k > n:
+                return -np.inf
+            return (lgamma(n + 1) - lgamma(k + 1) - lgamma(n - k + 1) +
+                    k * log_p + (n - k) * log_q)
+        k = np.trunc(np.asarray(k, dtype=np.float64))
+        valid = (k >= 0) & (k <= n)
+        k = np.where(valid, k, 0).astype(np.int64)
+        table = log_factorials(n)
+        logpmf = (table[n] - table[k] - table[n - k] +
+                  k * log_p + (n - k) * log_q)
+        return np.where(valid, logpmf, -np.inf)
+
     def pmf(self, k):
         '''
             Calculates the value of the
-            PMF for a given number of successes
+            PMF for a given number of successes,
+            k may be a number or an array of numbers
         '''
-        if type(k) is not int:
-            k = int(k)
-        if k < 0:
-            return 0
-        p = self.p
-        n = self.n
-        q = (1 - p)
-        n_factorial = 1
-        for i in range(n):
-            n_factorial *= (i + 1)
-        k_factorial = 1
-        for i in range(k):
-            k_factorial *= (i + 1)
-        nk_factorial = 1
-        for i in range(n - k):
-            nk_factorial *= (i + 1)
-        binomial_co = n_factorial / (k_factorial * nk_factorial)
-        pmf = binomial_co * (p ** k) * (q ** (n - k))
-        return pmf
+        if np.ndim(k) == 0:
+            if int(k) < 0:
+                return 0
+            return float(np.exp(self.logpmf(k)))
+        return np.exp(self.logpmf(k))
 
     def cdf(self, k):
         '''
             Calculates the value of the
-            CDF for a given number of successes
+            CDF for a given number of successes,
+            k may be a number or an array of numbers
         '''
-        if type(k) is not int:
-            k = int(k)
-        if k < 0:
-            return 0
-        p = self.p
         n = self.n
-        q = (1 - p)
-        summation = 0
-        for i in range(k + 1):
-            summation += self.pmf(i)
-        cdf = summation
-        return cdf
+        # F(k) = F(k - 1) + pmf(k), over the whole support at once
+        cumulative = np.cumsum(np.exp(self.logpmf(np.arange(n + 1))))
+        if np.ndim(k) == 0:
+            k = int(k)
+            if k < 0:
+                return 0
+            return float(cumulative[min(k, n)])
+        k = np.trunc(np.asarray(k, dtype=np.float64))
+        index = np.clip(k, 0, n).astype(np.int64)
+        return np.where(k < 0, 0., cumulative[index])
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+'''
+    Helpers shared by the distributions
+'''
+
+
+import numpy as np
+
+
+def log_factorials(n):
+    '''
+        Calculates log(k!) for every k from 0 to n
+    '''
+    logs = np.log(np.arange(1, n + 1, dtype=np.float64))
+    return np.concatenate(([0.], np.cumsum(logs)))
+
+
+def stream_mean(chunks):
+    '''
+        Calculates the mean of an iterable of chunks (numbers, lists or
+        numpy.ndarrays), one chunk in memory at a time
+    '''
+    count = 0
+    total = 0.
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=np.float64)
+        count += chunk.size
+        total += float(np.sum(chunk))
+    if count < 2:
+        raise ValueError('data must contain multiple values')
+    return total / count
@@ -5,6 +5,11 @@
 '''
 
 
+from math import exp, expm1
+import numpy as np
+stream_mean = __import__('distribution_helpers').stream_mean
+
+
 class Exponential:
     '''
         Class Exponential that represents
@@ -13,32 +18,64 @@ class Exponential:
     def __init__(self, data=None, lambtha=1.):
         '''
             Class constructor
+
+            data may be a list or a numpy.ndarray of values
         '''
         if data is None:
             if lambtha <= 0:
                 raise ValueError('lambtha must be a positive value')
             self.lambtha = float(lambtha)
         else:
-            if type(data) is not list:
+            if type(data) is not list and type(data) is not np.ndarray:
                 raise TypeError('data must be a list')
             if len(data) < 2:
                 raise ValueError('data must contain multiple values')
-            self.lambtha = float(1 / (sum(data) / len(data)))
+            mean = np.mean(data)
+            if mean <= 0:
+                raise ValueError('data must have a positive mean')
+            self.lambtha = float(1 / mean)
+
+    @classmethod
+    def from_stream(cls, chunks):
+        '''
+            Fits lambtha by maximum likelihood from an iterable of chunks
+            (numbers, lists or numpy.ndarrays), one chunk in memory at a time
+        '''
+        mean = stream_mean(chunks)
+        if mean <= 0:
+            raise ValueError('data must have a positive mean')
+        return cls(lambtha=1 / mean)
 
     def pdf(self, x):
         '''
             Calculates the value of the
-            PDF for a given time period
+            PDF for a given time period,
+            x may be a number or a numpy.ndarray
         '''
-        if x < 0:
-            return 0
-        return (self.lambtha * (2.7182818285 ** (-self.lambtha * x)))
+        if np.ndim(x) == 0:
+            if x < 0:
+                return 0
+            return self.lambtha * exp(-self.lambtha * x)
+        x = np.asarray(x, dtype=np.float64)
+        return np.where(x < 0, 0., self.lambtha * np.exp(-self.lambtha * x))
 
     def cdf(self, x):
         '''
             Calculates the value of the
-            CDF for a given time period
+            CDF for a given time period,
+            x may be a number or a numpy.ndarray
+        '''
+        if np.ndim(x) == 0:
+            if x < 0:
+                return 0
+            return -expm1(-self.lambtha * x)
+        x = np.asarray(x, dtype=np.float64)
+        return np.where(x < 0, 0., -np.expm1(-self.lambtha * x))
+
+    def rvs(self, size=None):
+        '''
+            Draws random samples from the distribution
+
+            size: output shape, None for a single float
         '''
-        if x < 0:
-            return 0
-        return 1 - (2.7182818285 ** (-self.lambtha * x))
+        return np.random.exponential(1 / self.lambtha, size)
@@ -4,6 +4,78 @@
 '''
 
 
+import numpy as np
+
+ERF_SERIES_TERMS = 30
+ERFC_FRACTION_TERMS = 40
+ERFC_SWITCH = 2.
+
+# Coefficients of Acklam's rational approximation of the inverse CDF
+PPF_A = (-3.969683028665376e+01, 2.209460984245205e+02,
+         -2.759285104469687e+02, 1.383577518672690e+02,
+         -3.066479806614716e+01, 2.506628277459239e+00)
+PPF_B = (-5.447609879822406e+01, 1.615858368580409e+02,
+         -1.556989798598866e+02, 6.680131188771972e+01,
+         -1.328068155288572e+01)
+PPF_C = (-7.784894002430293e-03, -3.223964580411365e-01,
+         -2.400758277161838e+00, -2.549732539343734e+00,
+         4.374664141464968e+00, 2.938163982698783e+00)
+PPF_D = (7.784695709041462e-03, 3.224671290700398e-01,
+         2.445134137142996e+00, 3.754408661907416e+00)
+PPF_LOW = 0.02425
+
+
+def erfc(x):
+    '''
+        Calculates the complementary error function of a number or array
+
+        Below ERFC_SWITCH erf is summed from its series with only
+        positive terms, above it erfc is evaluated directly as a
+        truncated continued fraction, so far tails keep their
+        relative accuracy
+    '''
+    x = np.asarray(x, dtype=np.float64)
+    a = np.abs(x)
+    result = np.empty_like(a)
+    small = a < ERFC_SWITCH
+
+    near = a[small]
+    term = near.copy()
+    total = near.copy()
+    double_square = 2 * near * near
+    for n in range(1, ERF_SERIES_TERMS + 1):
+        term *= double_square / (2 * n + 1)
+        total += term
+    result[small] = 1 - 2 / np.sqrt(np.pi) * np.exp(-near * near) * total
+
+    far = a[~small]
+    fraction = far.copy()
+    for k in range(ERFC_FRACTION_TERMS, 0, -1):
+        fraction = far + (k / 2) / fraction
+    result[~small] = np.exp(-far * far) / (np.sqrt(np.pi) * fraction)
+
+    return np.where(x < 0, 2 - result, result)
+
+
+def polynomial(coefficients, x):
+    '''
+        Evaluates a polynomial with Horner's rule, highest degree first
+    '''
+    result = 0.
+    for coefficient in coefficients:
+        result = result * x + coefficient
+    return result
+
+
+def scalar_or_array(value, like):
+    '''
+        Returns value as a float if like is a number, as is otherwise
+    '''
+    if np.ndim(like) == 0:
+        return float(value)
+    return value
+
+
 class Normal:
     '''
         Class Normal that represents
@@ -34,6 +106,28 @@ class Normal:
                 stddev = (summation / len(data)) ** (1 / 2)
                 self.stddev = stddev
 
+    @classmethod
+    def from_stream(cls, data):
+        '''
+            Creates a Normal distribution from any iterable of values,
+            estimating the mean and stddev in one pass (Welford) without
+            storing the values
+        '''
+        count = 0
+        mean = 0.
+        m2 = 0.
+        for x in data:
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+        if count < 2:
+            raise ValueError("data must contain multiple values")
+        normal = cls.__new__(cls)
+        normal.mean = float(mean)
+        normal.stddev = float((m2 / count) ** (1 / 2))
+        return normal
+
     def z_score(self, x):
         '''
             Calculates the z-score of a given x-value
@@ -46,31 +140,61 @@ class Normal:
         '''
         return (z * self.stddev) + self.mean
 
+    def logpdf(self, x):
+        '''
+            Calculates the value of the log PDF for a given x-value,
+            x may be a number or an array of numbers
+        '''
+        z = self.z_score(np.asarray(x, dtype=np.float64))
+        logpdf = -0.5 * z * z - np.log(self.stddev * np.sqrt(2 * np.pi))
+        return scalar_or_array(logpdf, x)
+
     def pdf(self, x):
         '''
             Calculates the value of the
-            PDF for a given x-value
+            PDF for a given x-value,
+            x may be a number or an array of numbers
         '''
-        mean = self.mean
-        stddev = self.stddev
-        e = 2.7182818285
-        pi = 3.1415926536
-        power = -0.5 * (self.z_score(x) ** 2)
-        coefficient = 1 / (stddev * ((2 * pi) ** (1 / 2)))
-        pdf = coefficient * (e ** power)
-        return pdf
+        return scalar_or_array(np.exp(self.logpdf(x)), x)
 
     def cdf(self, x):
         '''
             Calculates the value of the
-            CDF for a given x-value
-        '''
-        mean = self.mean
-        stddev = self.stddev
-        pi = 3.1415926536
-        value = (x - mean) / (stddev * (2 ** (1 / 2)))
-        val = value - ((value ** 3) / 3) + ((value ** 5) / 10)
-        val = val - ((value ** 7) / 42) + ((value ** 9) / 216)
-        val *= (2 / (pi ** (1 / 2)))
-        cdf = (1 / 2) * (1 + val)
-        return cdf
+            CDF for a given x-value,
+            x may be a number or an array of numbers
+        '''
+        z = self.z_score(np.asarray(x, dtype=np.float64))
+        return scalar_or_array(0.5 * erfc(-z / np.sqrt(2)), x)
+
+    def ppf(self, p):
+        '''
+            Calculates the x-value whose CDF is p (the inverse of cdf),
+            p may be a number or an array of numbers
+
+            Acklam's rational approximation refined by one Halley step
+        '''
+        q = np.asarray(p, dtype=np.float64)
+        z = np.full(q.shape, np.nan)
+        low = (q > 0) & (q < PPF_LOW)
+        high = (q < 1) & (q > 1 - PPF_LOW)
+        central = (q >= PPF_LOW) & (q <= 1 - PPF_LOW)
+
+        t = np.sqrt(-2 * np.log(q[low]))
+        z[low] = (polynomial(PPF_C, t) /
+                  (polynomial(PPF_D, t) * t + 1))
+        t = np.sqrt(-2 * np.log1p(-q[high]))
+        z[high] = -(polynomial(PPF_C, t) /
+                    (polynomial(PPF_D, t) * t + 1))
+        t = q[central] - 0.5
+        r = t * t
+        z[central] = (polynomial(PPF_A, r) * t /
+                      (polynomial(PPF_B, r) * r + 1))
+
+        inside = low | high | central
+        error = 0.5 * erfc(-z[inside] / np.sqrt(2)) - q[inside]
+        u = error * np.sqrt(2 * np.pi) * np.exp(0.5 * z[inside] ** 2)
+        z[inside] -= u / (1 + 0.5 * z[inside] * u)
+
+        z[q == 0] = -np.inf
+        z[q == 1] = np.inf
+        return scalar_or_array(self.x_value(z), p)
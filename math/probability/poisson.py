@@ -5,6 +5,16 @@
 '''
 
 
+from math import exp, lgamma, log
+import numpy as np
+from scipy.special import gammaincc, gammaln
+stream_mean = __import__('distribution_helpers').stream_mean
+
+# largest k whose CDF is a running sum of the PMF, past it the CDF is
+# the regularized upper incomplete gamma function, so no table is built
+CDF_TABLE = 4096
+
+
 class Poisson:
     '''
         Class Poisson that represents a
@@ -16,47 +26,94 @@ class Poisson:
         '''
         if k < 0:
             return 0
-        if k == 0 or k == 1:
-            return 1
-        return k * self.factorial(k - 1)
+        factorial = 1
+        for i in range(2, k + 1):
+            factorial *= i
+        return factorial
 
     def __init__(self, data=None, lambtha=1.):
         '''
             Class constructor
+
+            data may be a list or a numpy.ndarray of values
         '''
         if data is None:
             if lambtha <= 0:
                 raise ValueError('lambtha must be a positive value')
             self.lambtha = float(lambtha)
         else:
-            if type(data) is not list:
+            if type(data) is not list and type(data) is not np.ndarray:
                 raise TypeError('data must be a list')
             if len(data) < 2:
                 raise ValueError('data must contain multiple values')
-            self.lambtha = float(sum(data) / len(data))
+            self.lambtha = float(np.mean(data))
+
+    @classmethod
+    def from_stream(cls, chunks):
+        '''
+            Fits lambtha by maximum likelihood from an iterable of chunks
+            (numbers, lists or numpy.ndarrays), one chunk in memory at a time
+        '''
+        return cls(lambtha=stream_mean(chunks))
+
+    def logpmf(self, k):
+        '''
+            Calculates the value of the log PMF for a given number of
+            successes, k may be a number or an array of numbers
+        '''
+        lambtha = self.lambtha
+        if np.ndim(k) == 0:
+            if k < 0:
+                return -np.inf
+            k = int(k)
+            return k * log(lambtha) - lambtha - lgamma(k + 1)
+        k = np.asarray(k, dtype=np.float64)
+        valid = k >= 0
+        k = np.where(valid, np.trunc(k), 0)
+        # log(k!) of every k given, O(len(k)) whatever the largest k
+        logpmf = k * log(lambtha) - lambtha - gammaln(k + 1)
+        return np.where(valid, logpmf, -np.inf)
 
     def pmf(self, k):
         '''
             Calculates the value of the
-            PMF for a given number of successes
+            PMF for a given number of successes,
+            k may be a number or an array of numbers
         '''
-        if k < 0:
-            return 0
-        k = int(k)
-        e = 2.7182818285
-        return ((self.lambtha ** k) * (e ** (-self.lambtha))
-                ) / (self.factorial(k))
+        if np.ndim(k) == 0:
+            if k < 0:
+                return 0
+            return exp(self.logpmf(k))
+        return np.exp(self.logpmf(k))
 
     def cdf(self, k):
         '''
             Calculates the value of the
-            CDF for a given number of successes
+            CDF for a given number of successes,
+            k may be a number or an array of numbers
         '''
-        if type(k) is not int:
+        if np.ndim(k) == 0:
             k = int(k)
-        if k < 0:
-            return 0
-        cdf = 0
-        for i in range(k + 1):
-            cdf += self.pmf(i)
-        return cdf
+            if k < 0:
+                return 0
+            if k >= CDF_TABLE:
+                return float(gammaincc(k + 1, self.lambtha))
+            return float(np.sum(self.pmf(np.arange(k + 1))))
+        k = np.trunc(np.asarray(k, dtype=np.float64))
+        index = np.clip(k, 0, None)
+        top = int(index.max(initial=0))
+        if top >= CDF_TABLE:
+            cdf = gammaincc(index + 1, self.lambtha)
+        else:
+            # F(k) = F(k - 1) + pmf(k), up to the largest k requested
+            cumulative = np.cumsum(self.pmf(np.arange(top + 1)))
+            cdf = cumulative[index.astype(np.int64)]
+        return np.where(k < 0, 0., cdf)
+
+    def rvs(self, size=None):
+        '''
+            Draws random samples from the distribution
+
+            size: output shape, None for a single int
+        '''
+        return np.random.poisson(self.lambtha, size)
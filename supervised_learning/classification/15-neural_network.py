@@ -7,6 +7,10 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+mini_batch = __import__('mini_batch')
+check_batch_size = mini_batch.check_batch_size
+check_mini_batch = mini_batch.check_mini_batch
+MiniBatches = mini_batch.MiniBatches
 
 
 class NeuralNetwork:
@@ -14,9 +18,13 @@ class NeuralNetwork:
         A class NeuralNetwork
     '''
 
-    def __init__(self, nx, nodes):
+    def __init__(self, nx, nodes, dtype=np.float64):
         '''
             class constructor
+
+            dtype: float64, float32, or float16 to store the weights
+                in half precision while computing and updating them in
+                float32
         '''
         if type(nx) is not int:
             raise TypeError('nx must be an integer')
@@ -30,13 +38,23 @@ class NeuralNetwork:
         if nodes < 1:
             raise ValueError('nodes must be a positive integer')
 
+        if np.dtype(dtype) not in (np.float16, np.float32, np.float64):
+            raise ValueError('dtype must be float16, float32 or float64')
+
         self.nx = nx
         self.nodes = nodes
-        self.__W1 = np.random.randn(nodes, nx)
-        self.__b1 = np.zeros((nodes, 1))
+        self.__dtype = np.dtype(dtype)
+        self.__W1 = np.random.randn(nodes, nx).astype(dtype)
+        self.__b1 = np.zeros((nodes, 1), dtype)
         self.__A1 = 0
-        self.__W2 = np.random.randn(1, nodes)
+        self.__W2 = np.random.randn(1, nodes).astype(dtype)
         self.__b2 = 0
+        # W1, b1, W2 and b2 in the dtype computed in, for the updates to
+        # add up in float32 rather than be rounded away by float16
+        compute = np.promote_types(self.__dtype, np.float32)
+        self.__master = (self.__W1.astype(compute, copy=False),
+                         self.__b1.astype(compute, copy=False),
+                         self.__W2.astype(compute, copy=False), 0)
         self.__A2 = 0
 
     @property
@@ -81,10 +99,18 @@ class NeuralNetwork:
         '''
         return self.__A2
 
+    @property
+    def dtype(self):
+        '''
+            Getter
+        '''
+        return self.__dtype
+
     def forward_prop(self, X):
         '''
             Calculates the forward propagation of the neural network
         '''
+        X = np.asarray(X, dtype=np.promote_types(self.__dtype, np.float32))
         self.__A1 = np.matmul(self.__W1, X) + self.__b1
         self.__A1 = 1 / (1 + np.exp(-self.__A1))
         self.__A2 = np.matmul(self.__W2, self.__A1) + self.__b2
@@ -108,6 +134,33 @@ class NeuralNetwork:
         prediction = np.where(A2 >= 0.5, 1, 0)
         return prediction, cost
 
+    def predict(self, X, batch_size=None, probabilities=False):
+        '''
+            Predicts the labels of X, one chunk of batch_size examples
+            at a time, without changing A1 and A2
+
+            probabilities: return the activated output instead of labels
+
+            Returns: numpy.ndarray with shape (1, m) of the labels (1 if
+                the output is >= 0.5, 0 otherwise) or probabilities
+        '''
+        m = X.shape[1]
+        if batch_size is None:
+            batch_size = max(m, 1)
+        check_batch_size(batch_size)
+        dtype = np.promote_types(self.__dtype, np.float32)
+        prediction = np.empty((1, m), dtype if probabilities else int)
+        for start in range(0, m, batch_size):
+            end = start + batch_size
+            chunk = np.asarray(X[:, start:end], dtype=dtype)
+            A = 1 / (1 + np.exp(-(np.matmul(self.__W1, chunk) + self.__b1)))
+            A = 1 / (1 + np.exp(-(np.matmul(self.__W2, A) + self.__b2)))
+            if probabilities:
+                prediction[:, start:end] = A
+            else:
+                prediction[:, start:end] = A >= 0.5
+        return prediction
+
     def gradient_descent(self, X, Y, A1, A2, alpha=0.05):
         '''
             Calculates one pass of gradient descent on the neural network
@@ -116,20 +169,34 @@ class NeuralNetwork:
         dz2 = A2 - Y
         dw2 = (1 / m) * np.matmul(dz2, A1.T)
         db2 = (1 / m) * np.sum(dz2, axis=1, keepdims=True)
-        dz1 = np.matmul(self.__W2.T, dz2) * (A1 * (1 - A1))
+        W1, b1, W2, b2 = self.__master
+        dz1 = np.matmul(W2.T, dz2) * (A1 * (1 - A1))
         dw1 = (1 / m) * np.matmul(dz1, X.T)
         db1 = (1 / m) * np.sum(dz1, axis=1, keepdims=True)
-        self.__W2 = self.__W2 - (alpha * dw2)
-        self.__b2 = self.__b2 - (alpha * db2)
-        self.__W1 = self.__W1 - (alpha * dw1)
-        self.__b1 = self.__b1 - (alpha * db1)
+        W2 = W2 - (alpha * dw2)
+        b2 = b2 - (alpha * db2)
+        W1 = W1 - (alpha * dw1)
+        b1 = b1 - (alpha * db1)
+        self.__master = (W1, b1, W2, b2)
+        dtype = self.__dtype
+        self.__W2 = W2.astype(dtype, copy=False)
+        self.__b2 = b2.astype(dtype, copy=False)
+        self.__W1 = W1.astype(dtype, copy=False)
+        self.__b1 = b1.astype(dtype, copy=False)
         return self.__W1, self.__b1, self.__W2, self.__b2
 
     def train(
             self, X, Y, iterations=5000, alpha=0.05,
-            verbose=True, graph=True, step=100):
+            verbose=True, graph=True, step=100,
+            batch_size=None, epochs=None):
         '''
             Trains the neural network using gradient descent
+
+            With batch_size, trains for epochs passes over shuffled
+            mini-batches of batch_size examples instead of iterations
+            full-batch steps, and step counts epochs
+
+            The cost is only calculated when it is printed or graphed
         '''
         if type(iterations) is not int:
             raise TypeError('iterations must be an integer')
@@ -143,6 +210,7 @@ class NeuralNetwork:
         if alpha < 0:
             raise ValueError('alpha must be positive')
 
+        # only if verbose or graph are true
         if graph or verbose:
             if type(step) is not int:
                 raise TypeError('step must be an integer')
@@ -150,23 +218,53 @@ class NeuralNetwork:
             if step < 1 or step > iterations:
                 raise ValueError('step must be positive and <= iterations')
 
-        costs = []
-        iteration_list = []
-
-        for i in range(iterations+1):
-            # Forward propagation
-            A1, A2 = self.forward_prop(X)
+        if batch_size is not None:
+            check_mini_batch(batch_size, epochs)
+            iterations = epochs
+            # step was checked against iterations, it now counts epochs
+            step = min(step, epochs)
 
-            # compute the cost
-            cost = self.cost(Y, A2)
-            costs.append(cost)
-            iteration_list.append(i)
+        # math runs in float32 for float16 weights, cast the data once
+        X = np.asarray(X, dtype=np.promote_types(self.__dtype, np.float32))
+        Y = np.asarray(Y, dtype=np.promote_types(self.__dtype, np.float32))
 
-            if verbose and i % step == 0:
-                print("Cost after iteration {}: {}".format(i, cost))
+        # store the reported cost and iteration values
+        costs = []
+        iteration_list = []
 
-            # gradient descent for the
-            self.gradient_descent(X, Y, A1, A2)
+        if batch_size is None:
+            for i in range(iterations+1):
+                # Forward propagation
+                A1, A2 = self.forward_prop(X)
+
+                # compute the cost
+                if (verbose or graph) and i % step == 0:
+                    cost = self.cost(Y, A2)
+                    costs.append(cost)
+                    iteration_list.append(i)
+                    if verbose:
+                        print("Cost after iteration {}: {}".format(i, cost))
+
+                # gradient descent
+                self.gradient_descent(X, Y, A1, A2, alpha)
+        else:
+            batches = MiniBatches(X, Y, batch_size)
+            for i in range(iterations):
+                report = (verbose or graph) and i % step == 0
+                total = 0
+                for X_batch, Y_batch in batches:
+                    A1, A2 = self.forward_prop(X_batch)
+                    if report:
+                        total += self.cost(Y_batch, A2) * Y_batch.shape[1]
+                    self.gradient_descent(X_batch, Y_batch, A1, A2, alpha)
+
+                # mean cost of the batches of the epoch
+                if report:
+                    cost = total / Y.shape[1]
+                    costs.append(cost)
+                    iteration_list.append(i)
+                    if verbose:
+                        print("Cost after epoch {}: {}".format(i, cost))
 
         # Evaluation after training
         evaluation = self.evaluate(X, Y)
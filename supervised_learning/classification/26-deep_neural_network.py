@@ -7,6 +7,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import pickle
+model_io = __import__('model_io')
 
 
 class DeepNeuralNetwork:
@@ -153,6 +154,15 @@ class DeepNeuralNetwork:
             plt.show()
         return self.evaluate(X, Y)
 
+    def __getstate__(self):
+        '''
+            The cache is left out of pickles, it only holds the
+            activations of the last forward propagation
+        '''
+        state = self.__dict__.copy()
+        state['_DeepNeuralNetwork__cache'] = {}
+        return state
+
     def save(self, filename):
         '''
             Saves the instance object to a
@@ -177,3 +187,37 @@ class DeepNeuralNetwork:
                 return obj
         except FileNotFoundError:
             return None
+
+    def save_weights(self, filename):
+        '''
+            Saves only the weights and the configuration of the network
+            in the versioned format of model_io, appending
+            model_io.EXTENSION to filename if it is missing
+        '''
+        if type(filename) is not str:
+            return
+        model_io.save_weights(filename, self.__weights,
+                              {'nx': self.nx, 'layers': self.layers,
+                               'output': 'sigmoid'})
+
+    @classmethod
+    def load_weights(cls, filename, mmap=True):
+        '''
+            Loads a DeepNeuralNetwork saved by save_weights
+
+            With mmap, the weights are read-only views of the file that
+            processes loading it share; use mmap=False to train
+        '''
+        loaded = model_io.load_weights(filename, mmap)
+        if loaded is None:
+            return None
+        config, weights = loaded
+        if config.get('output') != 'sigmoid':
+            raise ValueError('the file does not hold a sigmoid output layer')
+        network = cls.__new__(cls)
+        network.__L = len(config['layers'])
+        network.__cache = {}
+        network.__weights = weights
+        network.nx = config['nx']
+        network.layers = config['layers']
+        return network
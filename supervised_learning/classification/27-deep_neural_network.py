@@ -5,6 +5,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import pickle
+model_io = __import__('model_io')
 
 
 class DeepNeuralNetwork:
@@ -146,6 +147,12 @@ class DeepNeuralNetwork:
             plt.show()
         return self.evaluate(X, Y)
 
+    def __getstate__(self):
+        """the cache of the last forward_prop is not pickled"""
+        state = self.__dict__.copy()
+        state['_DeepNeuralNetwork__cache'] = {}
+        return state
+
     def save(self, filename):
         """save as .pkl"""
         if not filename.endswith(".pkl"):
@@ -161,3 +168,35 @@ class DeepNeuralNetwork:
                 return pickle.load(f)
         except FileNotFoundError:
             return None
+
+    def save_weights(self, filename):
+        """save only the weights and the configuration of the network,
+        in the versioned format of model_io (model_io.EXTENSION is
+        appended to filename if missing)"""
+        W1 = self.__weights['W1']
+        layers = [self.__weights['b' + str(i)].shape[0]
+                  for i in range(1, self.__L + 1)]
+        model_io.save_weights(filename, self.__weights,
+                              {'nx': W1.shape[1], 'layers': layers,
+                               'activation': self.__activation,
+                               'output': 'softmax'})
+
+    @classmethod
+    def load_weights(cls, filename, mmap=True):
+        """load a network saved by save_weights
+
+        with mmap, the weights are read-only views of the file that
+        processes loading it share; use mmap=False to train
+        """
+        loaded = model_io.load_weights(filename, mmap)
+        if loaded is None:
+            return None
+        config, weights = loaded
+        if config.get('output') != 'softmax':
+            raise ValueError('the file does not hold a softmax output layer')
+        network = cls.__new__(cls)
+        network.__L = len(config['layers'])
+        network.__cache = {}
+        network.__weights = weights
+        network.__activation = config['activation']
+        return network
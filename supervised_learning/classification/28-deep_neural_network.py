@@ -5,13 +5,133 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import pickle
+model_io = __import__('model_io')
+mini_batch = __import__('mini_batch')
+check_batch_size = mini_batch.check_batch_size
+check_mini_batch = mini_batch.check_mini_batch
+MiniBatches = mini_batch.MiniBatches
+
+
+def sigmoid(z):
+    """sigmoid fxn, computed in place in z"""
+    np.negative(z, out=z)
+    np.exp(z, out=z)
+    z += 1
+    return np.reciprocal(z, out=z)
+
+
+def sigmoid_derivative(A, out):
+    """sigmoid derivative A * (1 - A), written to out"""
+    np.subtract(1, A, out=out)
+    return np.multiply(out, A, out=out)
+
+
+def tanh(z):
+    """tanh fxn, computed in place in z"""
+    return np.tanh(z, out=z)
+
+
+def tanh_derivative(A, out):
+    """tanh derivative 1 - A**2, written to out"""
+    np.square(A, out=out)
+    return np.subtract(1, out, out=out)
+
+
+def softmax(z):
+    """softmax fxn over the classes (axis 0), computed in place in z
+
+    the largest logit of every example is subtracted first, so exp
+    never overflows
+    """
+    z -= np.max(z, axis=0)
+    np.exp(z, out=z)
+    z /= np.sum(z, axis=0)
+    return z
+
+
+def softmax_cross_entropy(z, Y, dz, cost=True):
+    """fused softmax fxn, cross-entropy cost and its gradient
+
+    z: logits of the output layer, replaced in place by the softmax A
+    Y: labels, one-hot over axis 0
+    dz: buffer that receives the gradient A - Y
+    cost: whether to calculate the cost
+
+    the cost is taken from the log-softmax, z - max - log(sum(exp)),
+    so it stays finite when A underflows to 0
+
+    Returns: the cost (None if not calculated) and dz
+    """
+    z -= np.max(z, axis=0)
+    if cost:
+        # sum(Y * (z - log_norm)), with one exp pass shared with A
+        picked = np.vdot(Y, z)
+    np.exp(z, out=z)
+    norm = np.sum(z, axis=0)
+    if cost:
+        log_norm = np.dot(np.sum(Y, axis=0), np.log(norm))
+        cost = (log_norm - picked) / Y.shape[1]
+    else:
+        cost = None
+    z /= norm
+    return cost, np.subtract(z, Y, out=dz)
+
+
+# number of batch sizes whose workspaces are kept, enough for the
+# full batches and the last, smaller batch of an epoch
+WORKSPACES = 2
+
+# storage dtypes, float16 weights are computed with in float32
+DTYPES = (np.float16, np.float32, np.float64)
+
+
+def compute_dtype(dtype):
+    """dtype that the math of a network storing dtype runs in"""
+    return np.promote_types(dtype, np.float32)
+
+
+def master_weights(weights):
+    """copies of float16 weights in float32 for the updates to add up
+    in, float16 would round small updates away; the weights themselves
+    in the other dtypes"""
+    return {key: value.astype(compute_dtype(value.dtype), copy=False)
+            for key, value in weights.items()}
+
+
+# hidden layer activations: name -> (in place fxn, derivative from A)
+ACTIVATIONS = {
+    'sig': (sigmoid, sigmoid_derivative),
+    'tanh': (tanh, tanh_derivative),
+}
+
+
+class Workspace:
+    """buffers reused by every pass over a batch of m examples"""
+    def __init__(self, sizes, m, dtype=np.float64):
+        """sizes: nx followed by the number of nodes of every layer"""
+        self.m = m
+        self.A = [np.empty((n, m), dtype) for n in sizes[1:]]
+        self.dw = [np.empty((n, n_prev), dtype)
+                   for n_prev, n in zip(sizes[:-1], sizes[1:])]
+        self.db = [np.empty((n, 1), dtype) for n in sizes[1:]]
+        # dz and da of any layer are views of these flat buffers
+        self.dz = np.empty(max(sizes[1:]) * m, dtype)
+        self.da = np.empty(max(sizes[1:]) * m, dtype)
+
+    def view(self, flat, n):
+        """(n, m) view of the start of a flat buffer"""
+        return flat[:n * self.m].reshape(n, self.m)
 
 
 class DeepNeuralNetwork:
     """deep nn"""
-    def __init__(self, nx, layers, activation='sig'):
-        if activation not in ['sig', 'tanh']:
+    def __init__(self, nx, layers, activation='sig', dtype=np.float64):
+        """dtype: float64, float32, or float16 to store the weights in
+        half precision while computing and updating them in float32"""
+        if activation not in ACTIVATIONS:
             raise ValueError("activation must be 'sig' or 'tanh'")
+        if np.dtype(dtype) not in DTYPES:
+            raise ValueError('dtype must be float16, float32 or float64')
         if not isinstance(nx, int):
             raise TypeError('nx must be an integer')
         if nx < 1:
@@ -25,6 +145,9 @@ class DeepNeuralNetwork:
         self.__cache = {}
         self.__weights = {}
         self.__activation = activation
+        self.__dtype = np.dtype(dtype)
+        self.__sizes = [nx] + layers
+        self.__workspaces = {}
 
         for i in range(self.__L):
             if not isinstance(layers[i], int) or layers[i] < 1:
@@ -32,21 +155,53 @@ class DeepNeuralNetwork:
 
             if i == 0:
                 # He-et-al initialization
-                self.__weights['W' + str(i + 1)] = np.random.randn(
-                    layers[i], nx) * np.sqrt(2 / nx)
+                self.__weights['W' + str(i + 1)] = (np.random.randn(
+                    layers[i], nx) * np.sqrt(2 / nx)).astype(dtype)
             else:
                 # He-et-al initialization
-                self.__weights['W' + str(i + 1)] = np.random.randn(
-                    layers[i], layers[i - 1]) * np.sqrt(2 / layers[i - 1])
+                self.__weights['W' + str(i + 1)] = (np.random.randn(
+                    layers[i], layers[i - 1]) *
+                    np.sqrt(2 / layers[i - 1])).astype(dtype)
 
             # Zero initialization
-            self.__weights['b' + str(i + 1)] = np.zeros((layers[i], 1))
+            self.__weights['b' + str(i + 1)] = np.zeros((layers[i], 1), dtype)
+
+        self.__master = master_weights(self.__weights)
+        # keys of W, b and A for every layer, built once
+        self.__keys = [('W' + str(i), 'b' + str(i), 'A' + str(i))
+                       for i in range(self.__L + 1)]
+
+    def __getstate__(self):
+        """workspaces are rebuilt on demand and the cache only holds
+        the last forward_prop, so neither is pickled"""
+        state = self.__dict__.copy()
+        state['_DeepNeuralNetwork__workspaces'] = {}
+        state['_DeepNeuralNetwork__cache'] = {}
+        return state
+
+    def __workspace(self, m):
+        """preallocated buffers for batches of m examples, only the
+        WORKSPACES most recently used batch sizes are kept"""
+        workspace = self.__workspaces.pop(m, None)
+        if workspace is None:
+            if len(self.__workspaces) >= WORKSPACES:
+                # dicts keep insertion order, the first is the oldest
+                del self.__workspaces[next(iter(self.__workspaces))]
+            workspace = Workspace(self.__sizes, m,
+                                  compute_dtype(self.__dtype))
+        self.__workspaces[m] = workspace
+        return workspace
 
     @property
     def activation(self):
         """activation function """
         return self.__activation
 
+    @property
+    def dtype(self):
+        """dtype of the weights"""
+        return self.__dtype
+
     @property
     def L(self):
         """number of layers in the neural network"""
@@ -63,63 +218,146 @@ class DeepNeuralNetwork:
         return self.__weights
 
     def forward_prop(self, X):
-        """foward_prop of nn"""
-        self.cache["A0"] = X
-        for i in range(1, self.L+1):
-            W = self.weights['W'+str(i)]
-            b = self.weights['b'+str(i)]
-            A = self.cache['A'+str(i - 1)]
-            z = np.matmul(W, A) + b
+        """foward_prop of nn, into newly allocated activations"""
+        A = softmax(self.__logits(X))
+        self.__cache[self.__keys[self.L][2]] = A
+        return A, self.__cache
+
+    def __logits(self, X, workspace=None):
+        """forward pass up to the logits z of the output layer
+
+        with a workspace, the activations are written to its buffers,
+        which the next pass over as many examples overwrites
+        """
+        activation = ACTIVATIONS[self.activation][0]
+        A = np.asarray(X, dtype=compute_dtype(self.__dtype))
+        self.__cache['A0'] = A
+        for i in range(1, self.L + 1):
+            W_key, b_key, A_key = self.__keys[i]
+            out = None if workspace is None else workspace.A[i - 1]
+            z = np.matmul(self.__weights[W_key], A, out=out)
+            z += self.__weights[b_key]
             if i != self.L:
-                if self.activation == 'sig':
-                    A = 1 / (1 + np.exp(-z))  # sigmoid fxn
-                elif self.activation == 'tanh':
-                    A = np.tanh(z)  # tanh fxn
-            else:
-                A = np.exp(z) / np.sum(np.exp(z), axis=0)  # softmax fxn
-            self.cache["A"+str(i)] = A
-        return self.cache["A"+str(i)], self.cache
+                A = activation(z)
+                self.__cache[A_key] = A
+        return z
+
+    def __step(self, X, Y, alpha, cost):
+        """one fused forward pass, cost and gradient descent step
+
+        Returns: the cost before the step (None if cost is False)
+        """
+        workspace = self.__workspace(X.shape[1])
+        z = self.__logits(X, workspace)
+        cost, dz = softmax_cross_entropy(
+            z, Y, workspace.view(workspace.dz, z.shape[0]), cost)
+        self.__cache[self.__keys[self.L][2]] = z
+        self.__backward(dz, self.__cache, alpha)
+        return cost
 
     def cost(self, Y, A):
         """calculating cost"""
-        cost = -np.sum(Y * np.log(A)) / Y.shape[1]
+        # classes with Y == 0 are skipped, so A == 0 there is not a NaN
+        log_A = np.log(A, out=np.zeros_like(A), where=Y != 0)
+        cost = -np.sum(Y * log_A) / Y.shape[1]
         return cost
 
     def evaluate(self, X, Y):
         """evaluate"""
         self.forward_prop(X)
         A = self.cache.get("A" + str(self.L))
-        prediction = np.eye(A.shape[0])[np.argmax(A, axis=0)].T
+        # one-hot, set in place rather than gathered from np.eye
+        prediction = np.zeros(A.shape)
+        prediction[np.argmax(A, axis=0), np.arange(A.shape[1])] = 1
         cost = self.cost(Y, A)
         return prediction, cost
 
-    def gradient_descent(self, Y, cache, alpha=0.05):
-        """grad_descent"""
-        m = Y.shape[1]
-
-        for i in range(self.L, 0, -1):
+    def predict(self, X, batch_size=None, probabilities=False):
+        """predict the classes of X, one chunk of batch_size examples at
+        a time, without touching the cache or the workspaces, so that
+        the memory used is bounded by the chunk
 
-            A_prev = cache["A" + str(i - 1)]
-            A = cache["A" + str(i)]
-            W = self.__weights["W" + str(i)]
+        probabilities: return the softmax output instead of the classes
 
-            if i == self.L:
-                dz = A - Y
+        Returns: numpy.ndarray with shape (m,) of the class indices, or
+        with shape (classes, m) of the probabilities
+        """
+        m = X.shape[1]
+        if batch_size is None:
+            batch_size = max(m, 1)
+        check_batch_size(batch_size)
+        dtype = compute_dtype(self.__dtype)
+        if probabilities:
+            prediction = np.empty((self.__sizes[-1], m), dtype)
+        else:
+            prediction = np.empty(m, np.intp)
+        activation = ACTIVATIONS[self.activation][0]
+        # every layer reads one of these buffers and writes the other
+        size = max(self.__sizes[1:]) * min(batch_size, m)
+        buffers = (np.empty(size, dtype), np.empty(size, dtype))
+        for start in range(0, m, batch_size):
+            end = start + batch_size
+            A = np.asarray(X[:, start:end], dtype=dtype)
+            columns = A.shape[1]
+            for i in range(1, self.L + 1):
+                W_key, b_key, _ = self.__keys[i]
+                W = self.__weights[W_key]
+                z = buffers[i % 2][:W.shape[0] * columns]
+                z = np.matmul(W, A, out=z.reshape(W.shape[0], columns))
+                z += self.__weights[b_key]
+                A = activation(z) if i != self.L else z
+            if probabilities:
+                prediction[:, start:end] = softmax(A)
             else:
-                if self.activation == 'sig':
-                    dz = da * (A * (1 - A))  # sigmoid derivative
-                elif self.activation == 'tanh':
-                    dz = da * (1 - A**2)  # tanh der
+                # softmax keeps the order, the largest logit wins
+                np.argmax(A, axis=0, out=prediction[start:end])
+        return prediction
+
+    def gradient_descent(self, Y, cache, alpha=0.05):
+        """grad_descent, with the gradients kept in preallocated buffers"""
+        workspace = self.__workspace(Y.shape[1])
+        A = cache[self.__keys[self.L][2]]
+        dz = np.subtract(A, Y, out=workspace.view(workspace.dz, A.shape[0]))
+        self.__backward(dz, cache, alpha)
+
+    def __backward(self, dz, cache, alpha):
+        """backpropagates dz of the output layer and updates the weights"""
+        m = dz.shape[1]
+        workspace = self.__workspace(m)
+        derivative = ACTIVATIONS[self.activation][1]
+        for i in range(self.L, 0, -1):
+            W_key, b_key, _ = self.__keys[i]
+            A_prev = cache[self.__keys[i - 1][2]]
+            W = self.__master[W_key]
+            b = self.__master[b_key]
 
-            db = dz.mean(axis=1, keepdims=True)
-            dw = np.matmul(dz, A_prev.T) / m
-            da = np.matmul(W.T, dz)
-            self.weights['W' + str(i)] -= (alpha * dw)
-            self.weights['b' + str(i)] -= (alpha * db)
+            db = np.sum(dz, axis=1, keepdims=True, out=workspace.db[i - 1])
+            db *= alpha / m
+            dw = np.matmul(dz, A_prev.T, out=workspace.dw[i - 1])
+            dw *= alpha / m
+            if i > 1:
+                # dz of the previous layer, before W is updated
+                n = W.shape[1]
+                da = np.matmul(W.T, dz, out=workspace.view(workspace.da, n))
+                dz = derivative(A_prev, workspace.view(workspace.dz, n))
+                dz *= da
+            W -= dw
+            b -= db
+            if W is not self.__weights[W_key]:
+                # float16 weights, rounded from the float32 master copies
+                np.copyto(self.__weights[W_key], W, casting='same_kind')
+                np.copyto(self.__weights[b_key], b, casting='same_kind')
 
     def train(self, X, Y, iterations=5000,
-              alpha=0.05, verbose=True, graph=True, step=100):
-        """train"""
+              alpha=0.05, verbose=True, graph=True, step=100,
+              batch_size=None, epochs=None):
+        """train
+
+        with batch_size, trains for epochs passes over shuffled
+        mini-batches of batch_size examples instead of iterations
+        full-batch steps, and step counts epochs; the cost is only
+        calculated when it is printed or graphed
+        """
         if not isinstance(iterations, int):
             raise TypeError('iterations must be an integer')
         if iterations < 1:
@@ -128,16 +366,37 @@ class DeepNeuralNetwork:
             raise TypeError('alpha must be a float')
         if alpha < 0:
             raise ValueError('alpha must be positive')
+        if batch_size is not None:
+            check_mini_batch(batch_size, epochs)
+            iterations = epochs
+        # cast once, rather than on every forward pass
+        X = np.asarray(X, dtype=compute_dtype(self.__dtype))
+        Y = np.asarray(Y, dtype=compute_dtype(self.__dtype))
 
         costs = []
-        for i in range(iterations):
-            self.forward_prop(X)
-            self.gradient_descent(Y, self.cache, alpha)
-            if verbose and i % step == 0:
-
-                cost = self.cost(Y, self.cache["A"+str(self.L)])
-                costs.append(cost)
-                print('Cost after {} iterations: {}'.format(i, cost))
+        if batch_size is None:
+            for i in range(iterations):
+                report = (verbose or graph) and i % step == 0
+                cost = self.__step(X, Y, alpha, report)
+                if report:
+                    costs.append(cost)
+                    if verbose:
+                        print('Cost after {} iterations: {}'.format(i, cost))
+        else:
+            batches = MiniBatches(X, Y, batch_size)
+            for i in range(iterations):
+                report = (verbose or graph) and i % step == 0
+                total = 0
+                for X_batch, Y_batch in batches:
+                    cost = self.__step(X_batch, Y_batch, alpha, report)
+                    if report:
+                        total += cost * Y_batch.shape[1]
+                if report:
+                    # mean cost of the batches of the epoch
+                    cost = total / Y.shape[1]
+                    costs.append(cost)
+                    if verbose:
+                        print('Cost after {} epochs: {}'.format(i, cost))
         if graph:
             plt.plot(np.arange(0, iterations, step), costs)
             plt.xlabel('iteration')
@@ -161,3 +420,41 @@ class DeepNeuralNetwork:
                 return pickle.load(f)
         except FileNotFoundError:
             return None
+
+    def save_weights(self, filename):
+        """save only the weights and the configuration of the network,
+        in the versioned format of model_io (model_io.EXTENSION is
+        appended to filename if missing)"""
+        W1 = self.__weights['W1']
+        layers = [self.__weights['b' + str(i)].shape[0]
+                  for i in range(1, self.__L + 1)]
+        model_io.save_weights(filename, self.__weights,
+                              {'nx': W1.shape[1], 'layers': layers,
+                               'activation': self.__activation,
+                               'output': 'softmax'})
+
+    @classmethod
+    def load_weights(cls, filename, mmap=True):
+        """load a network saved by save_weights
+
+        with mmap, the weights are read-only views of the file that
+        processes loading it share; use mmap=False to train
+        """
+        loaded = model_io.load_weights(filename, mmap)
+        if loaded is None:
+            return None
+        config, weights = loaded
+        if config.get('output') != 'softmax':
+            raise ValueError('the file does not hold a softmax output layer')
+        network = cls.__new__(cls)
+        network.__L = len(config['layers'])
+        network.__cache = {}
+        network.__weights = weights
+        network.__master = master_weights(weights)
+        network.__activation = config['activation']
+        network.__dtype = weights['W1'].dtype
+        network.__sizes = [config['nx']] + config['layers']
+        network.__workspaces = {}
+        network.__keys = [('W' + str(i), 'b' + str(i), 'A' + str(i))
+                          for i in range(network.__L + 1)]
+        return network
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+
+import numpy as np
+Neuron = __import__('7-neuron').Neuron
+
+if __name__ == '__main__':
+    np.random.seed(0)
+    X = np.random.randn(4, 200)
+    Y = (X[:1] + X[1:2] > 0).astype(float)
+    neuron = Neuron(X.shape[0])
+    # mini-batches with the default step, verbose and graph
+    A, cost = neuron.train(X, Y, batch_size=32, epochs=10)
+    print(np.mean(A == Y), cost)
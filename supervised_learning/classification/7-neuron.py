@@ -7,23 +7,38 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+mini_batch = __import__('mini_batch')
+check_batch_size = mini_batch.check_batch_size
+check_mini_batch = mini_batch.check_mini_batch
+MiniBatches = mini_batch.MiniBatches
 
 
 class Neuron:
     '''
         Class Neuron
     '''
-    def __init__(self, nx):
+    def __init__(self, nx, dtype=np.float64):
         '''
             Constructor
+
+            dtype: float64, float32, or float16 to store the weights
+                in half precision while computing and updating them in
+                float32
         '''
         if type(nx) is not int:
             raise TypeError('nx must be an integer')
         if nx < 1:
             raise ValueError('nx must be a positive integer')
-        self.__W = np.random.randn(1, nx)
+        if np.dtype(dtype) not in (np.float16, np.float32, np.float64):
+            raise ValueError('dtype must be float16, float32 or float64')
+        self.__dtype = np.dtype(dtype)
+        self.__W = np.random.randn(1, nx).astype(dtype)
         self.__b = 0
         self.__A = 0
+        # W and b in the dtype computed in, for the updates to add up in
+        # float32 rather than be rounded away by float16
+        compute = np.promote_types(self.__dtype, np.float32)
+        self.__master = (self.__W.astype(compute, copy=False), 0)
 
     @property
     def W(self):
@@ -39,6 +54,13 @@ class Neuron:
         '''
         return self.__b
 
+    @property
+    def dtype(self):
+        '''
+            Getter
+        '''
+        return self.__dtype
+
     @property
     def A(self):
         '''
@@ -50,6 +72,7 @@ class Neuron:
         '''
             Calculates the forward propagation of the neuron
         '''
+        X = np.asarray(X, dtype=np.promote_types(self.__dtype, np.float32))
         self.__A = 1 / (1 + np.exp(-np.dot(self.__W, X) - self.__b))
         return self.__A
 
@@ -71,6 +94,32 @@ class Neuron:
         prediction = np.where(A >= 0.5, 1, 0)
         return prediction, cost
 
+    def predict(self, X, batch_size=None, probabilities=False):
+        '''
+            Predicts the labels of X, one chunk of batch_size examples
+            at a time, without changing A
+
+            probabilities: return the activated output instead of labels
+
+            Returns: numpy.ndarray with shape (1, m) of the labels (1 if
+                the output is >= 0.5, 0 otherwise) or probabilities
+        '''
+        m = X.shape[1]
+        if batch_size is None:
+            batch_size = max(m, 1)
+        check_batch_size(batch_size)
+        dtype = np.promote_types(self.__dtype, np.float32)
+        prediction = np.empty((1, m), dtype if probabilities else int)
+        for start in range(0, m, batch_size):
+            end = start + batch_size
+            chunk = np.asarray(X[:, start:end], dtype=dtype)
+            A = 1 / (1 + np.exp(-np.dot(self.__W, chunk) - self.__b))
+            if probabilities:
+                prediction[:, start:end] = A
+            else:
+                prediction[:, start:end] = A >= 0.5
+        return prediction
+
     def gradient_descent(self, X, Y, A, alpha=0.05):
         '''
             Calculates one pass of gradient descent on the neuron
@@ -79,16 +128,26 @@ class Neuron:
         dz = A - Y
         db = (1 / m) * np.sum(dz)
         dw = (1 / m) * np.matmul(X, dz.T)
-        self.__W = self.__W - (alpha * dw.T)
-        self.__b = self.__b - (alpha * db)
+        W, b = self.__master
+        W = W - (alpha * dw.T)
+        b = b - (alpha * db)
+        self.__master = (W, b)
+        self.__W = W.astype(self.__dtype, copy=False)
+        self.__b = b.astype(self.__dtype, copy=False)
         return self.__W, self.__b
 
     def train(
-        self, X, Y, iterations=5000, alpha=0.05, verbose=True,
-        graph=True, step=100
-    ):
+            self, X, Y, iterations=5000, alpha=0.05,
+            verbose=True, graph=True, step=100,
+            batch_size=None, epochs=None):
         '''
-            Trains the neuron
+            Trains the neuron using gradient descent
+
+            With batch_size, trains for epochs passes over shuffled
+            mini-batches of batch_size examples instead of iterations
+            full-batch steps, and step counts epochs
+
+            The cost is only calculated when it is printed or graphed
         '''
         if type(iterations) is not int:
             raise TypeError('iterations must be an integer')
@@ -110,24 +169,53 @@ class Neuron:
             if step < 1 or step > iterations:
                 raise ValueError('step must be positive and <= iterations')
 
-        # store the cost and iteration values
-        costs = []
-        iteration_list = []
-
-        for i in range(iterations+1):
-            # Forward propagation
-            A = self.forward_prop(X)
+        if batch_size is not None:
+            check_mini_batch(batch_size, epochs)
+            iterations = epochs
+            # step was checked against iterations, it now counts epochs
+            step = min(step, epochs)
 
-            # compute the cost
-            cost = self.cost(Y, A)
-            costs.append(cost)
-            iteration_list.append(i)
+        # math runs in float32 for float16 weights, cast the data once
+        X = np.asarray(X, dtype=np.promote_types(self.__dtype, np.float32))
+        Y = np.asarray(Y, dtype=np.promote_types(self.__dtype, np.float32))
 
-            if verbose and i % step == 0:
-                print("Cost after iteration {}: {}".format(i, cost))
+        # store the reported cost and iteration values
+        costs = []
+        iteration_list = []
 
-            # gradient descent for the
-            self.gradient_descent(X, Y, A)
+        if batch_size is None:
+            for i in range(iterations+1):
+                # Forward propagation
+                A = self.forward_prop(X)
+
+                # compute the cost
+                if (verbose or graph) and i % step == 0:
+                    cost = self.cost(Y, A)
+                    costs.append(cost)
+                    iteration_list.append(i)
+                    if verbose:
+                        print("Cost after iteration {}: {}".format(i, cost))
+
+                # gradient descent
+                self.gradient_descent(X, Y, A, alpha)
+        else:
+            batches = MiniBatches(X, Y, batch_size)
+            for i in range(iterations):
+                report = (verbose or graph) and i % step == 0
+                total = 0
+                for X_batch, Y_batch in batches:
+                    A = self.forward_prop(X_batch)
+                    if report:
+                        total += self.cost(Y_batch, A) * Y_batch.shape[1]
+                    self.gradient_descent(X_batch, Y_batch, A, alpha)
+
+                # mean cost of the batches of the epoch
+                if report:
+                    cost = total / Y.shape[1]
+                    costs.append(cost)
+                    iteration_list.append(i)
+                    if verbose:
+                        print("Cost after epoch {}: {}".format(i, cost))
 
         # Evaluation after training
         evaluation = self.evaluate(X, Y)
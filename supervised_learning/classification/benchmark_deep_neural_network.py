@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmarks a training iteration (forward_prop + gradient_descent) of
+the DeepNeuralNetwork, whose gradients go to preallocated buffers,
+against the allocating implementation of 27-deep_neural_network on
+MNIST-sized inputs, reporting throughput and the memory allocated per
+iteration; forward_prop allocates its activations in both, only train
+reuses buffers for them too
+"""
+
+
+import time
+import tracemalloc
+import numpy as np
+Allocating = __import__('27-deep_neural_network').DeepNeuralNetwork
+Preallocated = __import__('28-deep_neural_network').DeepNeuralNetwork
+
+NX = 784
+CLASSES = 10
+CASES = [
+    ([128, 64, CLASSES], 128),
+    ([128, 64, CLASSES], 1024),
+    ([256, 128, 64, CLASSES], 1024),
+    ([256, 128, 64, CLASSES], 8192),
+]
+ITERATIONS = 20
+
+
+def iteration(network, X, Y):
+    """
+    Runs one training iteration of network
+    """
+    network.forward_prop(X)
+    network.gradient_descent(Y, network.cache, 0.05)
+
+
+def measure(network, X, Y):
+    """
+    Times ITERATIONS iterations, then traces the memory of one more
+
+    returns:
+        (iterations per second, bytes allocated by one iteration)
+    """
+    iteration(network, X, Y)
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        iteration(network, X, Y)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    iteration(network, X, Y)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return ITERATIONS / elapsed, peak
+
+
+if __name__ == '__main__':
+    print("{:>22} {:>6} {:>13} {:>9} {:>11} {:>9} {:>10}".format(
+        "layers", "m", "network", "iter/s", "speedup", "alloc MB",
+        "max error"))
+    for layers, m in CASES:
+        np.random.seed(0)
+        X = np.random.rand(NX, m)
+        Y = np.eye(CLASSES)[np.random.randint(0, CLASSES, m)].T
+        np.random.seed(1)
+        allocating = Allocating(NX, layers)
+        np.random.seed(1)
+        preallocated = Preallocated(NX, layers)
+        base, base_peak = measure(allocating, X, Y)
+        rate, peak = measure(preallocated, X, Y)
+        error = max(np.max(np.abs(allocating.weights[key] -
+                                  preallocated.weights[key]))
+                    for key in allocating.weights)
+        for name, speed, allocated in (("allocating", base, base_peak),
+                                       ("preallocated", rate, peak)):
+            print("{:>22} {:>6} {:>13} {:>9.1f} {:>10.2f}x {:>9.2f} "
+                  "{:>10.1e}".format(str(layers), m, name, speed,
+                                     speed / base, allocated / 2 ** 20,
+                                     error))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmarks DeepNeuralNetwork training in float64, float32 and float16
+storage on MNIST-sized inputs, reporting the training time, the memory
+of the weights and the cost, the accuracy on held-out examples and its
+delta against float64
+"""
+
+
+import time
+import numpy as np
+DeepNeuralNetwork = __import__('28-deep_neural_network').DeepNeuralNetwork
+
+NX = 784
+CLASSES = 10
+LAYERS = [256, 128, CLASSES]
+EXAMPLES = 8192
+TEST_EXAMPLES = 2048
+BATCH_SIZE = 256
+EPOCHS = 10
+ALPHA = 0.1
+DTYPES = (np.float64, np.float32, np.float16)
+
+
+def teacher_data(teacher, m):
+    """
+    Random centered inputs in [-0.5, 0.5) labelled by a linear teacher
+        with shape (CLASSES, NX), so that the networks have something
+        to learn; uncentered inputs saturate tanh and barely train
+
+    returns:
+        X with shape (NX, m) and one-hot Y with shape (CLASSES, m)
+    """
+    X = np.random.rand(NX, m) - 0.5
+    labels = np.argmax(np.matmul(teacher, X), axis=0)
+    return X, np.eye(CLASSES)[labels].T
+
+
+if __name__ == '__main__':
+    np.random.seed(0)
+    teacher = np.random.randn(CLASSES, NX)
+    X, Y = teacher_data(teacher, EXAMPLES)
+    X_test, Y_test = teacher_data(teacher, TEST_EXAMPLES)
+    labels = np.argmax(Y_test, axis=0)
+    print("{:>8} {:>10} {:>9} {:>11} {:>10} {:>10} {:>12}".format(
+        "dtype", "time (s)", "speedup", "weights MB", "cost",
+        "accuracy", "acc. delta"))
+    base = None
+    for dtype in DTYPES:
+        np.random.seed(1)
+        network = DeepNeuralNetwork(NX, LAYERS, 'tanh', dtype)
+        # first pass outside the timing, it allocates the workspaces
+        network.train(X, Y, alpha=ALPHA, verbose=False, graph=False,
+                      batch_size=BATCH_SIZE, epochs=1)
+        start = time.perf_counter()
+        _, cost = network.train(X, Y, alpha=ALPHA, verbose=False,
+                                graph=False, batch_size=BATCH_SIZE,
+                                epochs=EPOCHS)
+        elapsed = time.perf_counter() - start
+        accuracy = np.mean(network.predict(X_test) == labels)
+        size = sum(array.nbytes for array in network.weights.values())
+        if base is None:
+            base = (elapsed, accuracy)
+        print("{:>8} {:>10.3f} {:>8.2f}x {:>11.2f} {:>10.4f} {:>10.4f} "
+              "{:>+12.4f}".format(np.dtype(dtype).name, elapsed,
+                                  base[0] / elapsed, size / 2 ** 20,
+                                  cost, accuracy, accuracy - base[1]))
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""shuffled mini-batches shared by the classifiers"""
+
+
+import numpy as np
+
+
+def check_batch_size(batch_size):
+    """validates a batch_size argument"""
+    if type(batch_size) is not int:
+        raise TypeError('batch_size must be an integer')
+    if batch_size < 1:
+        raise ValueError('batch_size must be a positive integer')
+
+
+def check_mini_batch(batch_size, epochs):
+    """validates the mini-batch arguments of train"""
+    check_batch_size(batch_size)
+    if type(epochs) is not int:
+        raise TypeError('epochs must be an integer')
+    if epochs < 1:
+        raise ValueError('epochs must be a positive integer')
+
+
+class MiniBatches:
+    """
+    iterates over (X, Y) in mini-batches of batch_size examples, in a
+    new random order on every pass
+
+    only a permutation of the indices is shuffled: the batches are
+    gathered from X and Y into buffers that are reused from batch to
+    batch, so a batch is overwritten by the next one
+    """
+    def __init__(self, X, Y, batch_size, shuffle=True):
+        self.X = X
+        self.Y = Y
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.m = X.shape[1]
+        self.__buffers = {}
+
+    def __len__(self):
+        """number of batches in a pass"""
+        return -(-self.m // self.batch_size)
+
+    def __buffer(self, size):
+        """buffers of X and Y for a batch of size examples"""
+        buffer = self.__buffers.get(size)
+        if buffer is None:
+            buffer = (np.empty((self.X.shape[0], size), self.X.dtype),
+                      np.empty((self.Y.shape[0], size), self.Y.dtype))
+            self.__buffers[size] = buffer
+        return buffer
+
+    def __iter__(self):
+        """one pass over the data"""
+        if not self.shuffle:
+            # in order, the batches are views of X and Y
+            for start in range(0, self.m, self.batch_size):
+                end = start + self.batch_size
+                yield self.X[:, start:end], self.Y[:, start:end]
+            return
+        order = np.random.permutation(self.m)
+        for start in range(0, self.m, self.batch_size):
+            index = order[start:start + self.batch_size]
+            X_batch, Y_batch = self.__buffer(index.size)
+            # the indices come from the permutation, so they are in range;
+            # mode='raise' would gather into a temporary copied to out
+            np.take(self.X, index, axis=1, out=X_batch, mode='clip')
+            np.take(self.Y, index, axis=1, out=Y_batch, mode='clip')
+            yield X_batch, Y_batch
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+    Weights-only, versioned serialization of the classifiers
+
+    A file holds MAGIC, the length of a JSON header (little-endian
+    uint32), the header itself, then the raw arrays, each one starting
+    on an ALIGNMENT byte boundary. The header keeps the format version,
+    the configuration of the model, and the dtype, shape and offset of
+    every array, so the arrays can be memory-mapped read-only and
+    shared by every process that loads the same file
+"""
+
+
+import json
+import numpy as np
+
+MAGIC = b'\x93DNN'
+VERSION = 1
+ALIGNMENT = 64
+EXTENSION = '.weights'
+
+
+def align(offset):
+    '''
+        Rounds offset up to the next multiple of ALIGNMENT
+    '''
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def save_weights(filename, weights, config):
+    '''
+        Saves a dict of numpy.ndarrays and the configuration of a model
+
+        filename: path of the file, EXTENSION is appended if missing
+        weights: dict of numpy.ndarrays, e.g. {'W1': ..., 'b1': ...}
+        config: JSON serializable dict needed to rebuild the model
+    '''
+    if not filename.endswith(EXTENSION):
+        filename += EXTENSION
+    arrays = {}
+    order = []
+    offset = 0
+    for name, array in weights.items():
+        array = np.ascontiguousarray(array)
+        array = array.astype(array.dtype.newbyteorder('<'), copy=False)
+        arrays[name] = {'dtype': array.dtype.str,
+                        'shape': list(array.shape),
+                        'offset': offset}
+        order.append(array)
+        offset = align(offset + array.nbytes)
+    header = json.dumps({'version': VERSION, 'config': config,
+                         'arrays': arrays}).encode('utf-8')
+    # the arrays start on an aligned offset after the header
+    start = align(len(MAGIC) + 4 + len(header))
+    header += b' ' * (start - len(MAGIC) - 4 - len(header))
+    with open(filename, 'wb') as f:
+        f.write(MAGIC)
+        f.write(len(header).to_bytes(4, 'little'))
+        f.write(header)
+        for array, info in zip(order, arrays.values()):
+            f.seek(start + info['offset'])
+            f.write(array.tobytes())
+        f.truncate(start + offset)
+
+
+def load_weights(filename, mmap=True):
+    '''
+        Loads a file written by save_weights
+
+        mmap: if True the arrays are read-only views of a memory map
+            of the file, only paged in when used; otherwise they are
+            read into writable arrays
+
+        Returns: (config, weights), or None if the file does not exist
+    '''
+    try:
+        with open(filename, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError('{} is not a weights file'.format(filename))
+            length = int.from_bytes(f.read(4), 'little')
+            header = json.loads(f.read(length).decode('utf-8'))
+            if header['version'] > VERSION:
+                raise ValueError('unsupported weights version {}'.format(
+                    header['version']))
+            start = len(MAGIC) + 4 + length
+            weights = {}
+            if mmap:
+                buffer = np.memmap(f, np.uint8, 'r')
+            for name, info in header['arrays'].items():
+                dtype = np.dtype(info['dtype'])
+                shape = tuple(info['shape'])
+                if mmap:
+                    weights[name] = np.ndarray(shape, dtype, buffer,
+                                               start + info['offset'])
+                else:
+                    f.seek(start + info['offset'])
+                    count = int(np.prod(shape))
+                    weights[name] = np.fromfile(
+                        f, dtype, count).reshape(shape)
+    except FileNotFoundError:
+        return None
+    return header['config'], weights
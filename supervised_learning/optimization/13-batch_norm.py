@@ -6,7 +6,8 @@
 '''
 
 
-import numpy as np
+moments = __import__('batch_norm_layer').moments
+normalize = __import__('batch_norm_layer').normalize
 
 
 def batch_norm(Z, gamma, beta, epsilon):
@@ -27,8 +28,6 @@ def batch_norm(Z, gamma, beta, epsilon):
         Returns:
             - The normalized Z matrix
     '''
-    mean = np.mean(Z, axis=0)
-    variance = np.var(Z, axis=0)
-    Z_norm = (Z - mean) / np.sqrt(variance + epsilon)
-    Z_tilde = gamma * Z_norm + beta
-    return Z_tilde
+    # mean and variance in one pass, then normalized into one new array
+    mean, variance = moments(Z)
+    return normalize(Z, gamma, beta, mean, variance, epsilon)
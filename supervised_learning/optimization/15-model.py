@@ -6,6 +6,9 @@
 
 import numpy as np
 import tensorflow as tf
+BatchLoader = __import__('batch_loader').BatchLoader
+RunningMetrics = __import__('metrics').RunningMetrics
+streamed_metrics = __import__('metrics').streamed_metrics
 
 
 def shuffle_data(X, Y):
@@ -183,6 +186,7 @@ def model(
     batch_size=32,
     epochs=5,
     save_path="/tmp/model.ckpt",
+    full_metrics=False,
 ):
     """
 
@@ -204,6 +208,9 @@ def model(
         epochs: number of times the training should pass through the whole
                 dataset
         save_path: path where the model should be saved to
+        full_metrics: whether to re-evaluate the training cost and
+                    accuracy over all of X_train after every epoch,
+                    instead of averaging those of the epoch's batches
 
     Returns:  path where the model was saved
     """
@@ -238,21 +245,19 @@ def model(
 
     with tf.Session() as sess:
         sess.run(init)
-        m = X_train.shape[0]
-        if (m % batch_size) == 0:
-            num_minibatches = int(m / batch_size)
-            check = 1
-        else:
-            num_minibatches = int(m / batch_size) + 1
-            check = 0
+        # shuffles indices and gathers the next batches in the background
+        loader = BatchLoader(X_train, Y_train, batch_size)
+
+        metrics = RunningMetrics()
 
         for epoch in range(epochs + 1):
-            feed_train = {x: X_train, y: Y_train}
-            feed_valid = {x: X_valid, y: Y_valid}
-            train_cost = sess.run(loss, feed_dict=feed_train)
-            train_accuracy = sess.run(accuracy, feed_dict=feed_train)
-            valid_cost = sess.run(loss, feed_dict=feed_valid)
-            valid_accuracy = sess.run(accuracy, feed_dict=feed_valid)
+            if epoch == 0 or full_metrics:
+                train_cost, train_accuracy = streamed_metrics(
+                    sess, loss, accuracy, x, y, X_train, Y_train)
+            else:
+                train_cost, train_accuracy = metrics.result()
+            valid_cost, valid_accuracy = streamed_metrics(
+                sess, loss, accuracy, x, y, X_valid, Y_valid)
 
             print("After {} epochs:".format(epoch))
             print("\tTraining Cost: {}".format(train_cost))
@@ -261,24 +266,15 @@ def model(
             print("\tValidation Accuracy: {}".format(valid_accuracy))
 
             if epoch < epochs:
-                Xs, Ys = shuffle_data(X_train, Y_train)
-
-                for step_number in range(num_minibatches):
-                    start = step_number * batch_size
-                    end = (step_number + 1) * batch_size
-                    if check == 0 and step_number == num_minibatches - 1:
-                        x_minbatch = Xs[start::]
-                        y_minbatch = Ys[start::]
-                    else:
-                        x_minbatch = Xs[start:end]
-                        y_minbatch = Ys[start:end]
-
+                metrics.reset()
+                for step_number, (x_minbatch, y_minbatch) in enumerate(loader):
                     feed_mini = {x: x_minbatch, y: y_minbatch}
-                    sess.run(train_op, feed_dict=feed_mini)
+                    # the cost and accuracy of the batch, before the update
+                    _, step_cost, step_accuracy = sess.run(
+                        [train_op, loss, accuracy], feed_dict=feed_mini)
+                    metrics.add(step_cost, step_accuracy, x_minbatch.shape[0])
 
                     if ((step_number + 1) % 100 == 0) and (step_number != 0):
-                        step_cost = sess.run(loss, feed_dict=feed_mini)
-                        step_accuracy = sess.run(accuracy, feed_dict=feed_mini)
                         print("\tStep {}:".format(step_number + 1))
                         print("\t\tCost: {}".format(step_cost))
                         print("\t\tAccuracy: {}".format(step_accuracy))
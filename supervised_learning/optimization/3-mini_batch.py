@@ -6,7 +6,9 @@
 
 
 import tensorflow as tf
-shuffle_data = __import__("2-shuffle_data").shuffle_data
+BatchLoader = __import__("batch_loader").BatchLoader
+RunningMetrics = __import__("metrics").RunningMetrics
+streamed_metrics = __import__("metrics").streamed_metrics
 
 
 def train_mini_batch(
@@ -18,6 +20,7 @@ def train_mini_batch(
     epochs=5,
     load_path="/tmp/model.ckpt",
     save_path="/tmp/model.ckpt",
+    full_metrics=False,
 ):
     """
     Args
@@ -39,6 +42,9 @@ def train_mini_batch(
         the model
         - save_path is the path to where the model
         should be saved after training
+        - full_metrics is whether to re-evaluate the training
+        cost and accuracy over all of X_train after every epoch,
+        instead of averaging those of the batches of the epoch
         - x is a placeholder for the input data
         - y is a placeholder for the labels
         - accuracy is an op to calculate the accuracy
@@ -59,15 +65,18 @@ def train_mini_batch(
         train_op = tf.get_collection("train_op")[0]
         accuracy = tf.get_collection("accuracy")[0]
         loss = tf.get_collection("loss")[0]
-        size = X_train.shape[0] // batch_size
-        if X_train.shape[0] % batch_size != 0:
-            size += 1
+        # shuffles indices and gathers the next batches in the background
+        loader = BatchLoader(X_train, Y_train, batch_size)
+        metrics = RunningMetrics()
         for i in range(epochs + 1):
-            cost_t, acc_t = sess.run(
-                [loss, accuracy], feed_dict={x: X_train, y: Y_train}
-            )
-            cost_v, acc_v = sess.run(
-                [loss, accuracy], feed_dict={x: X_valid, y: Y_valid}
+            if i == 0 or full_metrics:
+                cost_t, acc_t = streamed_metrics(
+                    sess, loss, accuracy, x, y, X_train, Y_train
+                )
+            else:
+                cost_t, acc_t = metrics.result()
+            cost_v, acc_v = streamed_metrics(
+                sess, loss, accuracy, x, y, X_valid, Y_valid
             )
             print("After {} epochs:".format(i))
             print("\tTraining Cost: {}".format(cost_t))
@@ -75,18 +84,16 @@ def train_mini_batch(
             print("\tValidation Cost: {}".format(cost_v))
             print("\tValidation Accuracy: {}".format(acc_v))
             if i < epochs:
-                x_shuffled, y_shuffled = shuffle_data(X_train, Y_train)
-                for i in range(size):
-                    start = i * batch_size
-                    end = start + batch_size
-                    x_mini = x_shuffled[start:end]
-                    y_mini = y_shuffled[start:end]
-                    sess.run(train_op, feed_dict={x: x_mini, y: y_mini})
-                    if (i + 1) % 100 == 0 and i > 0:
-                        cost, acc = sess.run(
-                            [loss, accuracy], feed_dict={x: x_mini, y: y_mini}
-                        )
-                        print("\tStep {}:".format(i + 1))
+                metrics.reset()
+                for step, (x_mini, y_mini) in enumerate(loader, 1):
+                    # the cost and accuracy of the batch, before the update
+                    _, cost, acc = sess.run(
+                        [train_op, loss, accuracy],
+                        feed_dict={x: x_mini, y: y_mini}
+                    )
+                    metrics.add(cost, acc, x_mini.shape[0])
+                    if step % 100 == 0:
+                        print("\tStep {}:".format(step))
                         print("\t\tCost: {}".format(cost))
                         print("\t\tAccuracy: {}".format(acc))
         return saver.save(sess, save_path)
@@ -5,18 +5,34 @@
 """
 
 
-def moving_average(data, beta):
+import numpy as np
+from scipy.signal import lfilter
+
+
+def moving_average(data, beta, axis=0):
     """
     Calculates the weighted moving average of a data set
 
+    The recurrence V = beta * V + (1 - beta) * x is a first order
+        linear filter, run by lfilter in a single vectorized pass
+
     Args:
-        - data is the list of data to calculate the moving average of
+        - data is the list of data to calculate the moving average of,
+        or a numpy.ndarray averaged along axis
         - beta is the weight used for the moving average
         - Your moving average calculation should use bias correction
+
+    Returns:
+        - a list of the moving averages if data is a list, a
+        numpy.ndarray of the shape of data otherwise
     """
-    V = 0
-    moving_avg = []
-    for i in range(len(data)):
-        V = beta * V + (1 - beta) * data[i]
-        moving_avg.append(V / (1 - beta ** (i + 1)))
-    return moving_avg
+    values = np.asarray(data, dtype=np.float64)
+    V = lfilter([1 - beta], [1, -beta], values, axis=axis)
+    steps = np.arange(1, values.shape[axis] + 1)
+    correction = 1 - np.power(float(beta), steps)
+    shape = [1] * values.ndim
+    shape[axis] = -1
+    moving_avg = V / correction.reshape(shape)
+    if isinstance(data, np.ndarray):
+        return moving_avg
+    return moving_avg.tolist()
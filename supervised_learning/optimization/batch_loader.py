@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+'''
+    Mini-batch loader that shuffles indices instead of the data and
+    prefetches the next batches on a background thread
+'''
+
+
+import queue
+import threading
+import numpy as np
+
+
+class BatchLoader:
+    '''
+        Iterates over the mini-batches of (X, Y), in a new random order
+        on every pass
+
+        Only a permutation of the indices is shuffled. The batches are
+        gathered with np.take into prefetch + 1 preallocated buffers
+        while the previous batch is used, so the memory stays at one
+        copy of the data plus a few batches. A batch must not be kept
+        after the next one is requested: its buffer is then reused
+    '''
+
+    def __init__(self, X, Y, batch_size=32, shuffle=True, prefetch=2):
+        '''
+            Args:
+                - X is a numpy.ndarray of shape (m, nx)
+                - Y is a numpy.ndarray of shape (m, ny)
+                - batch_size is the number of data points in a batch
+                - shuffle is whether to visit the data in a random order
+                - prefetch is the number of batches gathered ahead
+        '''
+        self.X = X
+        self.Y = Y
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.m = X.shape[0]
+        size = min(batch_size, self.m)
+        self.__buffers = [(np.empty((size,) + X.shape[1:], X.dtype),
+                           np.empty((size,) + Y.shape[1:], Y.dtype))
+                          for _ in range(prefetch + 1)]
+
+    def __len__(self):
+        '''
+            Number of batches in a pass
+        '''
+        return -(-self.m // self.batch_size)
+
+    def __fill(self, order, ready, free, stop):
+        '''
+            Gathers the batches of order into the free buffers,
+            in the background thread
+        '''
+        try:
+            for start in range(0, self.m, self.batch_size):
+                buffer = free.get()
+                if buffer is None or stop.is_set():
+                    return
+                index = order[start:start + self.batch_size]
+                count = index.size
+                # the indices come from the permutation, so they are in
+                # range; mode='raise' would gather into a temporary
+                # copied to out
+                np.take(self.X, index, axis=0, out=buffer[0][:count],
+                        mode='clip')
+                np.take(self.Y, index, axis=0, out=buffer[1][:count],
+                        mode='clip')
+                ready.put((buffer, count))
+        except Exception as error:
+            ready.put(error)
+            return
+        ready.put(None)
+
+    def __iter__(self):
+        '''
+            One pass over the data
+        '''
+        if not self.shuffle:
+            # in order, the batches are views of X and Y
+            for start in range(0, self.m, self.batch_size):
+                end = start + self.batch_size
+                yield self.X[start:end], self.Y[start:end]
+            return
+        order = np.random.permutation(self.m)
+        ready = queue.Queue()
+        free = queue.Queue()
+        for buffer in self.__buffers:
+            free.put(buffer)
+        stop = threading.Event()
+        thread = threading.Thread(target=self.__fill,
+                                  args=(order, ready, free, stop),
+                                  daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = ready.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                buffer, count = item
+                yield buffer[0][:count], buffer[1][:count]
+                free.put(buffer)
+        finally:
+            # wakes the thread up if it waits for a buffer
+            stop.set()
+            free.put(None)
+            thread.join()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+'''
+    Batch normalization layer in numpy, with running statistics
+    and a fused inference path
+'''
+
+
+import numpy as np
+
+CHUNK = 1024
+
+
+def moments(Z, chunk=CHUNK):
+    '''
+        Calculates the mean and variance of every feature of Z in one
+        pass over memory: the rows are read a chunk at a time, and the
+        mean and sum of squared deviations of every chunk are merged
+        into the running ones (Welford, in Chan et al.'s pairwise form)
+
+        Args:
+            - Z is a numpy.ndarray of shape (m, n)
+            - chunk is the number of rows of a chunk
+
+        Returns:
+            - the mean and variance, numpy.ndarrays of shape (n,)
+    '''
+    count = 0
+    mean = np.zeros(Z.shape[1])
+    m2 = np.zeros(Z.shape[1])
+    for start in range(0, Z.shape[0], chunk):
+        block = Z[start:start + chunk]
+        size = block.shape[0]
+        block_mean = block.mean(axis=0)
+        deviation = block - block_mean
+        block_m2 = np.einsum('ij,ij->j', deviation, deviation)
+        delta = block_mean - mean
+        total = count + size
+        mean += delta * (size / total)
+        m2 += block_m2 + delta * delta * (count * size / total)
+        count = total
+    return mean, m2 / count
+
+
+def normalize(Z, gamma, beta, mean, variance, epsilon, out=None):
+    '''
+        Calculates gamma * (Z - mean) / sqrt(variance + epsilon) + beta
+        in place in out, centering Z before scaling it: with the
+        statistics of the batch, Z * scale + shift would subtract two
+        large numbers when the mean is large against the deviation
+    '''
+    out = np.subtract(Z, mean, out=out)
+    out /= np.sqrt(variance + epsilon)
+    out *= gamma
+    out += beta
+    return out
+
+
+def scale_shift(gamma, beta, mean, variance, epsilon):
+    '''
+        Folds the normalization and gamma/beta into one scale and
+        shift per feature: gamma * (Z - mean) / sqrt(variance + epsilon)
+        + beta == Z * scale + shift
+    '''
+    scale = gamma / np.sqrt(variance + epsilon)
+    shift = beta - mean * scale
+    return scale, shift
+
+
+class BatchNorm:
+    '''
+        Batch normalization of the unactivated output Z, of shape (m, n),
+        of a layer
+
+        Training normalizes with the statistics of the batch and updates
+        the running mean and variance; inference normalizes with the
+        running statistics, which do not change between batches, folded
+        into a single scale and shift
+    '''
+
+    def __init__(self, n, epsilon=1e-8, momentum=0.99):
+        '''
+            Args:
+                - n is the number of features
+                - epsilon is a small number used to avoid division by zero
+                - momentum is the weight of the running statistics in
+                their moving averages
+        '''
+        self.gamma = np.ones((1, n))
+        self.beta = np.zeros((1, n))
+        self.epsilon = epsilon
+        self.momentum = momentum
+        self.running_mean = np.zeros((1, n))
+        self.running_var = np.ones((1, n))
+
+    def forward(self, Z, training=True, out=None):
+        '''
+            Normalizes Z
+
+            Args:
+                - Z is a numpy.ndarray of shape (m, n)
+                - training is whether to use and learn the statistics of
+                the batch, or to use the running statistics
+                - out is an optional numpy.ndarray of shape (m, n) that
+                receives the result (it may be Z itself)
+
+            Returns:
+                - the normalized Z
+        '''
+        if training:
+            mean, variance = moments(Z)
+            self.running_mean *= self.momentum
+            self.running_mean += (1 - self.momentum) * mean
+            self.running_var *= self.momentum
+            self.running_var += (1 - self.momentum) * variance
+            return normalize(Z, self.gamma, self.beta, mean, variance,
+                             self.epsilon, out)
+        scale, shift = self.fold()
+        out = np.multiply(Z, scale, out=out)
+        out += shift
+        return out
+
+    def fold(self):
+        '''
+            Returns:
+                - the inference scale and shift, numpy.ndarrays of
+                shape (1, n)
+        '''
+        return scale_shift(self.gamma, self.beta, self.running_mean,
+                           self.running_var, self.epsilon)
+
+    def fold_into(self, W, b):
+        '''
+            Folds the inference normalization into the preceding layer
+            Z = np.matmul(A_prev, W) + b, so that the layer outputs the
+            normalized Z directly
+
+            Args:
+                - W is a numpy.ndarray of shape (nx, n)
+                - b is a numpy.ndarray of shape (1, n)
+
+            Returns:
+                - the folded W and b
+        '''
+        scale, shift = self.fold()
+        return W * scale, b * scale + shift
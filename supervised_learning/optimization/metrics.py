@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+'''
+    Loss and accuracy of the TF1 training loops, accumulated from the
+    batches already run or evaluated in streamed chunks
+'''
+
+EVAL_BATCH_SIZE = 4096
+
+
+class RunningMetrics:
+    '''
+        Mean loss and accuracy of the batches seen so far, weighted by
+        the number of data points in every batch
+    '''
+
+    def __init__(self):
+        '''
+            Starts with no batches
+        '''
+        self.reset()
+
+    def reset(self):
+        '''
+            Forgets the batches seen so far
+        '''
+        self.count = 0
+        self.loss = 0.
+        self.accuracy = 0.
+
+    def add(self, loss, accuracy, count):
+        '''
+            Adds the mean loss and accuracy of a batch of count points
+        '''
+        self.count += count
+        self.loss += float(loss) * count
+        self.accuracy += float(accuracy) * count
+
+    def result(self):
+        '''
+            Returns: the mean loss and accuracy
+        '''
+        return self.loss / self.count, self.accuracy / self.count
+
+
+def streamed_metrics(sess, loss, accuracy, x, y, X, Y,
+                     batch_size=EVAL_BATCH_SIZE):
+    '''
+        Evaluates loss and accuracy over X and Y in chunks of batch_size
+        data points, fetching both with a single sess.run per chunk
+
+        Args:
+            - sess is the tf.Session
+            - loss and accuracy are the mean loss and accuracy ops
+            - x and y are the placeholders of the data and labels
+            - X is a numpy.ndarray of shape (m, nx)
+            - Y is a one-hot numpy.ndarray of shape (m, classes)
+            - batch_size is the number of data points in a chunk
+
+        Returns: the loss and accuracy over all of X
+    '''
+    metrics = RunningMetrics()
+    for start in range(0, X.shape[0], batch_size):
+        X_chunk = X[start:start + batch_size]
+        Y_chunk = Y[start:start + batch_size]
+        chunk_loss, chunk_accuracy = sess.run(
+            [loss, accuracy], feed_dict={x: X_chunk, y: Y_chunk})
+        metrics.add(chunk_loss, chunk_accuracy, X_chunk.shape[0])
+    return metrics.result()
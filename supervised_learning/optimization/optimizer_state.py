@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+'''
+    In-place gradient descent with momentum, RMSProp and Adam over all
+    the parameters of a network at once
+'''
+
+
+import numpy as np
+
+METHODS = ('momentum', 'RMSProp', 'Adam')
+
+
+class OptimizerState:
+    '''
+        Keeps the parameters, their gradients and every moment of the
+        optimizer in one flat contiguous buffer each, so that a step
+        is a handful of vector operations over the whole network
+        instead of several small ones per parameter
+    '''
+
+    def __init__(self, params, method='Adam', alpha=0.001, beta1=0.9,
+                 beta2=0.999, epsilon=1e-8):
+        '''
+            Args:
+                - params is a dict of numpy.ndarrays, e.g. the weights
+                of a network; its values are replaced by views of the
+                flat parameter buffer, so that the network sees the
+                updates in place
+                - method is 'momentum', 'RMSProp' or 'Adam'
+                - alpha is the learning rate
+                - beta1 is the weight used for the first moment
+                - beta2 is the weight used for the second moment
+                - epsilon is a small number to avoid division by zero
+        '''
+        if method not in METHODS:
+            raise ValueError('method must be one of {}'.format(METHODS))
+        self.method = method
+        self.alpha = alpha
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+        self.t = 0
+        dtype = np.result_type(*params.values())
+        if not np.issubdtype(dtype, np.floating):
+            dtype = np.float64
+        size = sum(np.size(value) for value in params.values())
+        self.flat_params = np.empty(size, dtype)
+        self.flat_grads = np.zeros(size, dtype)
+        self.__scratch = np.empty(size, dtype)
+        self.v = np.zeros(size, dtype) if method != 'RMSProp' else None
+        self.s = np.zeros(size, dtype) if method != 'momentum' else None
+        self.grads = {}
+        offset = 0
+        for name, value in params.items():
+            shape = np.shape(value)
+            end = offset + int(np.prod(shape))
+            view = self.flat_params[offset:end].reshape(shape)
+            view[...] = value
+            params[name] = view
+            self.grads[name] = self.flat_grads[offset:end].reshape(shape)
+            offset = end
+        self.params = params
+
+    def step(self, grads=None):
+        '''
+            Updates every parameter in place
+
+            Args:
+                - grads is a dict of the gradients of the parameters;
+                if None, the gradients must already have been written
+                to the views in self.grads
+
+            Returns:
+                - the dict of the updated parameters
+        '''
+        if grads is not None:
+            for name, grad in grads.items():
+                self.grads[name][...] = grad
+        grad = self.flat_grads
+        scratch = self.__scratch
+        self.t += 1
+        if self.method != 'RMSProp':
+            # v = beta1 * v + (1 - beta1) * grad
+            self.v *= self.beta1
+            np.multiply(grad, 1 - self.beta1, out=scratch)
+            self.v += scratch
+        if self.method == 'momentum':
+            np.multiply(self.v, self.alpha, out=scratch)
+            self.flat_params -= scratch
+            return self.params
+        # s = beta2 * s + (1 - beta2) * grad ** 2
+        self.s *= self.beta2
+        np.square(grad, out=scratch)
+        scratch *= 1 - self.beta2
+        self.s += scratch
+        np.sqrt(self.s, out=scratch)
+        if self.method == 'RMSProp':
+            scratch += self.epsilon
+            np.divide(grad, scratch, out=scratch)
+            scratch *= self.alpha
+        else:
+            # bias corrections folded into two scalars
+            scratch /= np.sqrt(1 - self.beta2 ** self.t)
+            scratch += self.epsilon
+            np.divide(self.v, scratch, out=scratch)
+            scratch *= self.alpha / (1 - self.beta1 ** self.t)
+        self.flat_params -= scratch
+        return self.params
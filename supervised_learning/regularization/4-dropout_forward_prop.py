@@ -6,9 +6,10 @@
 
 
 import numpy as np
+make_mask = __import__('dropout_masks').make_mask
 
 
-def dropout_forward_prop(X, weights, L, keep_prob):
+def dropout_forward_prop(X, weights, L, keep_prob, mask='int'):
     """
     Conducts forward propagation using Dropout
 
@@ -19,6 +20,9 @@ def dropout_forward_prop(X, weights, L, keep_prob):
         - L: number of layers in the network
         - keep_prob: probability that a node will be kept
         - keep_prob: probability that a node will be kept for dropout
+        - mask: how the dropout masks are cached, 'int' (8 bytes per
+        node), 'bool' (1 byte), 'packed' (1 bit) or 'seed' (a seed per
+        layer that the mask is regenerated from)
 
     Returns:
         - a dictionary containing the outputs of each layer and
@@ -30,7 +34,8 @@ def dropout_forward_prop(X, weights, L, keep_prob):
         W = weights["W" + str(i + 1)]
         b = weights["b" + str(i + 1)]
         A = cache["A" + str(i)]
-        Z = np.matmul(W, A) + b
+        Z = np.matmul(W, A)
+        Z += b
 
         if i == L - 1:
             # Softmax activation for the output layer
@@ -38,12 +43,11 @@ def dropout_forward_prop(X, weights, L, keep_prob):
             cache["A" + str(i + 1)] = t / np.sum(t, axis=0, keepdims=True)
         else:
             # Tanh activation for hidden layers
-            A = np.tanh(Z)
+            A = np.tanh(Z, out=Z)
 
-            # Dropout mask
-            D = ((np.random.rand(A.shape[0], A.shape[1])
-                  < keep_prob).astype(int))
-            A *= D
+            # Dropout mask, applied and scaled in place
+            D, keep = make_mask(A.shape, keep_prob, mask)
+            A *= keep
             A /= keep_prob
             cache["A" + str(i + 1)] = A
             cache["D" + str(i + 1)] = D
@@ -7,6 +7,7 @@
 """
 
 import numpy as np
+mask_array = __import__('dropout_masks').mask_array
 
 
 def dropout_gradient_descent(Y, weights, cache, alpha, keep_prob, L):
@@ -23,7 +24,8 @@ def dropout_gradient_descent(Y, weights, cache, alpha, keep_prob, L):
         of the neural network
         - cache is a dictionary of the outputs and dropout
         masks of each layer of
-        the neural network
+        the neural network, the masks stored in any of the modes
+        of dropout_forward_prop
         - alpha is the learning rate
         - keep_prob is the probability that a node will be kept
         - L is the number of layers of the network
@@ -47,9 +49,10 @@ def dropout_gradient_descent(Y, weights, cache, alpha, keep_prob, L):
         db = (1 / m) * np.sum(dz, axis=1, keepdims=True)
 
         if layer > 1:
-            D_prev = cache['D' + str(layer - 1)]
+            D_prev = mask_array(cache['D' + str(layer - 1)])
             A_prev = cache['A' + str(layer - 1)]
-            dz = np.matmul(W.T, dz) * (1 - A_prev ** 2)
+            dz = np.matmul(W.T, dz)
+            dz *= 1 - A_prev ** 2
             dz *= D_prev  # Apply dropout mask
             dz /= keep_prob  # Scale the activation for the dropped units
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+    Dropout masks stored as int arrays (8 bytes per activation), bool
+    arrays (1 byte), packed bits (1 bit), or only a seed that the
+    backward pass regenerates them from
+"""
+
+
+import numpy as np
+
+MASK_MODES = ('int', 'bool', 'packed', 'seed')
+
+
+class PackedMask:
+    """
+    Dropout mask packed 8 nodes per byte with np.packbits
+    """
+
+    def __init__(self, keep, shape):
+        """
+        Args:
+            - keep: boolean numpy.ndarray, True for the kept nodes
+            - shape: shape of the mask
+        """
+        self.bits = np.packbits(keep, axis=None)
+        self.shape = shape
+
+    def unpack(self):
+        """
+        Returns:
+            - the mask as a boolean numpy.ndarray
+        """
+        size = int(np.prod(self.shape))
+        keep = np.unpackbits(self.bits, count=size)
+        return keep.view(bool).reshape(self.shape)
+
+
+class SeededMask:
+    """
+    Dropout mask kept as the seed of the generator that draws it
+    """
+
+    def __init__(self, seed, shape, keep_prob):
+        """
+        Args:
+            - seed: seed of the numpy.random.Generator of the mask
+            - shape: shape of the mask
+            - keep_prob: probability that a node is kept
+        """
+        self.seed = seed
+        self.shape = shape
+        self.keep_prob = keep_prob
+
+    def unpack(self):
+        """
+        Returns:
+            - the mask regenerated as a boolean numpy.ndarray
+        """
+        rng = np.random.default_rng(self.seed)
+        return rng.random(self.shape) < self.keep_prob
+
+
+def make_mask(shape, keep_prob, mode='int'):
+    """
+    Draws a dropout mask
+
+    Args:
+        - shape: shape of the activations
+        - keep_prob: probability that a node will be kept
+        - mode: how the mask is stored, one of MASK_MODES; int, bool
+        and packed masks draw the same nodes from np.random
+
+    Returns:
+        - the mask to cache and the mask to apply, as a numpy.ndarray
+    """
+    if mode not in MASK_MODES:
+        raise ValueError("mode must be one of {}".format(MASK_MODES))
+    if mode == 'seed':
+        mask = SeededMask(np.random.randint(2 ** 31), shape, keep_prob)
+        return mask, mask.unpack()
+    keep = np.random.rand(*shape) < keep_prob
+    if mode == 'int':
+        keep = keep.astype(int)
+        return keep, keep
+    if mode == 'packed':
+        return PackedMask(keep, shape), keep
+    return keep, keep
+
+
+def mask_array(D):
+    """
+    Returns:
+        - the cached mask D as a numpy.ndarray
+    """
+    if isinstance(D, np.ndarray):
+        return D
+    return D.unpack()
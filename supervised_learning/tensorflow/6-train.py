@@ -40,34 +40,27 @@ def train(X_train, Y_train, X_valid, Y_valid, layer_sizes, activations,
 
     with tf.Session() as sess:
         sess.run(init)
-        for i in range(iterations):
-            loss_train = sess.run(loss,
-                                  feed_dict={x: X_train, y: Y_train})
-            accuracy_train = sess.run(accuracy,
-                                      feed_dict={x: X_train, y: Y_train})
-            loss_valid = sess.run(loss,
-                                  feed_dict={x: X_valid, y: Y_valid})
-            accuracy_valid = sess.run(accuracy,
-                                      feed_dict={x: X_valid, y: Y_valid})
-            if (i % 100) is 0:
+        feed_train = {x: X_train, y: Y_train}
+        feed_valid = {x: X_valid, y: Y_valid}
+        for i in range(iterations + 1):
+            if i % 100 == 0 or i == iterations:
+                # loss and accuracy in one run, only when printed;
+                # validation first, so that both use the weights
+                # from before the train step
+                loss_valid, accuracy_valid = sess.run(
+                    [loss, accuracy], feed_dict=feed_valid)
+                if i < iterations:
+                    # the train step shares the forward pass
+                    _, loss_train, accuracy_train = sess.run(
+                        [train_op, loss, accuracy], feed_dict=feed_train)
+                else:
+                    loss_train, accuracy_train = sess.run(
+                        [loss, accuracy], feed_dict=feed_train)
                 print("After {} iterations:".format(i))
                 print("\tTraining Cost: {}".format(loss_train))
                 print("\tTraining Accuracy: {}".format(accuracy_train))
                 print("\tValidation Cost: {}".format(loss_valid))
                 print("\tValidation Accuracy: {}".format(accuracy_valid))
-            sess.run(train_op, feed_dict={x: X_train, y: Y_train})
-        i += 1
-        loss_train = sess.run(loss,
-                              feed_dict={x: X_train, y: Y_train})
-        accuracy_train = sess.run(accuracy,
-                                  feed_dict={x: X_train, y: Y_train})
-        loss_valid = sess.run(loss,
-                              feed_dict={x: X_valid, y: Y_valid})
-        accuracy_valid = sess.run(accuracy,
-                                  feed_dict={x: X_valid, y: Y_valid})
-        print("After {} iterations:".format(i))
-        print("\tTraining Cost: {}".format(loss_train))
-        print("\tTraining Accuracy: {}".format(accuracy_train))
-        print("\tValidation Cost: {}".format(loss_valid))
-        print("\tValidation Accuracy: {}".format(accuracy_valid))
+            else:
+                sess.run(train_op, feed_dict=feed_train)
         return saver.save(sess, save_path)